@@ -2,13 +2,22 @@
 Configuration Management for Enhanced Meshtastic Monitor
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path once; the set of config paths is small and fixed"""
+    return tuple(path.split('.'))
+
+
 class ConfigManager:
     """Manages application configuration with validation and defaults"""
     
@@ -16,6 +25,7 @@ class ConfigManager:
         self.config_dir = config_dir
         self.config_file = os.path.join(config_dir, "app_config.json")
         self.config = {}
+        self._saved_digest = None  # Digest of the config as last loaded/saved
         self.load_config()
     
     def load_config(self):
@@ -24,6 +34,7 @@ class ConfigManager:
             try:
                 with open(self.config_file, 'r') as f:
                     self.config = json.load(f)
+                self._saved_digest = self._digest(json.dumps(self.config, indent=2))
                 logger.info(f"Configuration loaded from {self.config_file}")
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
@@ -33,30 +44,49 @@ class ConfigManager:
             self.config = self._get_default_config()
             self.save_config()
     
-    def save_config(self):
-        """Save current configuration to file"""
-        os.makedirs(self.config_dir, exist_ok=True)
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        """Content digest used to detect no-op saves"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def save_config(self, force: bool = False):
+        """Save current configuration to file
+        
+        The write is skipped when the serialized config is identical to what
+        was last loaded or saved (e.g. OK pressed with nothing changed), which
+        avoids needless SD card writes on the Pi. Pass force=True to always write.
+        """
         try:
+            text = json.dumps(self.config, indent=2)
+            digest = self._digest(text)
+            if not force and digest == self._saved_digest and os.path.exists(self.config_file):
+                logger.debug("Configuration unchanged, skipping save")
+                return
+            os.makedirs(self.config_dir, exist_ok=True)
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+                f.write(text)
+            self._saved_digest = digest
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
     
     def get(self, path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'alerts.email_enabled')"""
-        parts = path.split('.')
+        return self.get_path(_split_path(path), default)
+    
+    def get_path(self, keys: Tuple[str, ...], default: Any = None) -> Any:
+        """Get configuration value from a pre-split key tuple (e.g., ('alerts', 'email_enabled'))"""
         value = self.config
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
+        for key in keys:
+            if isinstance(value, dict) and key in value:
+                value = value[key]
             else:
                 return default
         return value
     
     def set(self, path: str, value: Any):
         """Set configuration value using dot notation"""
-        parts = path.split('.')
+        parts = _split_path(path)
         config = self.config
         for part in parts[:-1]:
             if part not in config:
@@ -64,6 +94,37 @@ class ConfigManager:
             config = config[part]
         config[parts[-1]] = value
     
+    def update_many(self, updates: Dict[str, Any]) -> bool:
+        """Set several dot-notation values in one pass.
+        
+        Parent dicts are resolved once per distinct prefix, so sibling keys
+        (e.g. all of 'alerts.email_config.*') share a single tree walk.
+        
+        Returns:
+            True if any value was added or changed
+        """
+        changed = False
+        parents = {}
+        for path, value in updates.items():
+            prefix, _, leaf = path.rpartition('.')
+            parent = parents.get(prefix)
+            if parent is None:
+                parent = self.config
+                if prefix:
+                    for part in _split_path(prefix):
+                        if part not in parent:
+                            parent[part] = {}
+                        parent = parent[part]
+                parents[prefix] = parent
+            if leaf not in parent or parent[leaf] != value:
+                parent[leaf] = value
+                changed = True
+        return changed
+    
+    def get_all(self) -> Dict[str, Any]:
+        """Get the full configuration dict (live reference, not a copy)"""
+        return self.config
+    
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get entire configuration section"""
         return self.config.get(section, {})
@@ -14,23 +14,133 @@ Usage:
 """
 
 import sys
+import time
 import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QGroupBox, QLabel, QLineEdit, QComboBox, QCheckBox,
     QPushButton, QRadioButton, QButtonGroup, QGridLayout,
-    QFrame, QMessageBox, QSizePolicy
+    QMessageBox
 )
 from PySide6.QtCore import Qt, Signal
 
-from config_manager import ConfigManager
-from qt_styles import (create_button, create_ok_button, create_apply_button, 
+from qt_styles import (create_button, create_apply_button,
                        create_cancel_button, COLORS, CHECKBOX_STYLE, 
                        RADIOBUTTON_STYLE, TAB_STYLE, GROUPBOX_STYLE)
 
+try:
+    import serial.tools.list_ports as serial_list_ports
+except ImportError:  # pyserial normally ships with meshtastic
+    serial_list_ports = None
+
+if TYPE_CHECKING:
+    from config_manager import ConfigManager
+
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing config sections, so loading values
+# doesn't build a throwaway empty dict for every .get() miss
+_EMPTY_SECTION = MappingProxyType({})
+
+# Pre-split config key paths for the current sensor settings
+_SENSOR_DEFAULT_KEYS = ('hardware', 'current_sensor', 'default')
+_SENSOR_NODES_KEYS = ('hardware', 'current_sensor', 'nodes')
+
+# Serial port enumeration scans /sys (or the registry on Windows), so the
+# result is reused for a couple of seconds while the dialog is open
+_PORT_CACHE_TTL = 2.0
+_PORT_CACHE = {'ts': 0.0, 'ports': None}
+
+
+def _enumerate_serial_ports(force: bool = False) -> list:
+    """Return sorted serial device names, reusing a recent enumeration"""
+    now = time.monotonic()
+    if (not force and _PORT_CACHE['ports'] is not None
+            and now - _PORT_CACHE['ts'] < _PORT_CACHE_TTL):
+        return _PORT_CACHE['ports']
+    if serial_list_ports is None:
+        raise ImportError("pyserial is not installed")
+    ports = [port.device for port in sorted(serial_list_ports.comports())]
+    _PORT_CACHE['ts'] = now
+    _PORT_CACHE['ports'] = ports
+    return ports
+
+
+def _set_if_changed(label, text: str):
+    """Set label text only when it differs, avoiding a needless relayout/repaint"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _static_text_label(text: str, object_name: str) -> QLabel:
+    """Create a multi-line help label as plain, non-interactive text.
+    
+    Skips QLabel's rich-text detection and text interaction handling,
+    which is wasted work for fixed help blurbs.
+    """
+    label = QLabel(text)
+    label.setTextFormat(Qt.PlainText)
+    label.setTextInteractionFlags(Qt.NoTextInteraction)
+    label.setObjectName(object_name)
+    return label
+
+
+# Dialog-wide stylesheet, built once at import. Labels that need special
+# styling get an objectName and are matched by the #id rules below instead
+# of carrying their own per-widget setStyleSheet() call.
+_DIALOG_STYLESHEET = f"""
+    QDialog {{
+        background-color: {COLORS['bg_main']};
+    }}
+    QLabel {{
+        color: {COLORS['fg_normal']};
+    }}
+    QLineEdit, QComboBox {{
+        background-color: {COLORS['bg_input']};
+        color: {COLORS['fg_normal']};
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11pt;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {COLORS['bg_input']};
+        color: {COLORS['fg_normal']};
+        selection-background-color: #555555;
+        selection-color: white;
+    }}
+    QLabel#metricValue {{
+        font-weight: bold;
+        color: {COLORS['accent']};
+    }}
+    QLabel#hint {{
+        color: gray;
+    }}
+    QLabel#help {{
+        font-size: 9pt;
+        color: #aaaaaa;
+    }}
+    QLabel#smallHint {{
+        font-size: 8pt;
+        color: gray;
+    }}
+    QLabel#fieldDescription {{
+        font-size: 10pt;
+        color: gray;
+    }}
+    QLabel#sectionTitle {{
+        font-weight: bold;
+        font-size: 11pt;
+    }}
+    {CHECKBOX_STYLE}
+    {RADIOBUTTON_STYLE}
+    {TAB_STYLE}
+    {GROUPBOX_STYLE}
+"""
+
 
 class SettingsDialogQt(QDialog):
     """Qt-based configuration dialog for dashboard settings"""
@@ -38,12 +148,13 @@ class SettingsDialogQt(QDialog):
     # Signal emitted when settings are applied (for immediate refresh)
     settings_changed = Signal()
     
-    def __init__(self, parent, config_manager: ConfigManager, data_collector=None):
+    def __init__(self, parent, config_manager: 'ConfigManager', data_collector=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.data_collector = data_collector  # Optional, for per-node hardware settings
         self.result = None
         self._current_hardware_node = "default"  # Track selected node for hardware settings
+        self._hardware_text_cache = {}  # {config path: (voltage_text, current_text)}
         
         self.setWindowTitle("Dashboard Settings")
         self.setMinimumSize(650, 550)
@@ -52,8 +163,10 @@ class SettingsDialogQt(QDialog):
         # Initialize widget references
         self._init_widget_refs()
         
+        # Only the initially visible tab is built here; the rest are built
+        # (and loaded from config) the first time they are selected
         self.create_widgets()
-        self.load_current_values()
+        self._ensure_tab_built(self.tab_widget.currentIndex())
     
     def _init_widget_refs(self):
         """Initialize widget reference attributes"""
@@ -63,6 +176,7 @@ class SettingsDialogQt(QDialog):
         self.serial_radio = None
         self.tcp_group = None
         self.serial_group = None
+        self._last_conn_is_tcp = None  # Connection type currently shown (None = not yet)
         self.tcp_host = None
         self.tcp_port = None
         self.serial_port = None
@@ -95,6 +209,7 @@ class SettingsDialogQt(QDialog):
         self.smtp_password = None
         self.from_address = None
         self.to_addresses = None
+        self._to_addrs_model = []  # Recipient list as stored in config
         self.use_tls = None
         
         # Logging widgets
@@ -103,6 +218,7 @@ class SettingsDialogQt(QDialog):
         
         # Hardware widgets
         self.hardware_node_selector = None
+        self.current_sensor_invert = None
         self.current_sensor_enabled = None
         self.full_scale_voltage_mv = None
         self.full_scale_current_a = None
@@ -116,71 +232,37 @@ class SettingsDialogQt(QDialog):
         layout.setContentsMargins(10, 10, 10, 10)
         
         # Apply dark theme styles to this dialog
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['bg_main']};
-            }}
-            QLabel {{
-                color: {COLORS['fg_normal']};
-            }}
-            QLineEdit, QComboBox {{
-                background-color: {COLORS['bg_input']};
-                color: {COLORS['fg_normal']};
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11pt;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {COLORS['bg_input']};
-                color: {COLORS['fg_normal']};
-                selection-background-color: #555555;
-                selection-color: white;
-            }}
-            {CHECKBOX_STYLE}
-            {RADIOBUTTON_STYLE}
-            {TAB_STYLE}
-            {GROUPBOX_STYLE}
-        """)
-        
-        # Tab widget
-        tab_widget = QTabWidget()
-        layout.addWidget(tab_widget)
-        
-        # Connection tab
-        conn_tab = QWidget()
-        tab_widget.addTab(conn_tab, "Connection")
-        self.create_connection_tab(conn_tab)
-        
-        # Dashboard tab
-        dash_tab = QWidget()
-        tab_widget.addTab(dash_tab, "Dashboard")
-        self.create_dashboard_tab(dash_tab)
-        
-        # Telemetry tab - DISABLED for now, needs more work
-        # telemetry_tab = QWidget()
-        # tab_widget.addTab(telemetry_tab, "Telemetry")
-        # self.create_telemetry_tab(telemetry_tab)
-        
-        # Alerts tab
-        alerts_tab = QWidget()
-        tab_widget.addTab(alerts_tab, "Alerts")
-        self.create_alerts_tab(alerts_tab)
-        
-        # Email tab
-        email_tab = QWidget()
-        tab_widget.addTab(email_tab, "Email")
-        self.create_email_tab(email_tab)
-        
-        # Hardware tab
-        hardware_tab = QWidget()
-        tab_widget.addTab(hardware_tab, "Hardware")
-        self.create_hardware_tab(hardware_tab)
-        
-        # Logging tab
-        logging_tab = QWidget()
-        tab_widget.addTab(logging_tab, "Logging")
-        self.create_logging_tab(logging_tab)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
+        
+        # Tab widget - each tab starts as an empty page and is filled in by
+        # _ensure_tab_built() on first activation
+        self.tab_widget = QTabWidget()
+        layout.addWidget(self.tab_widget)
+        
+        # (title, build, load values, collect values)
+        self._tab_specs = [
+            ("Connection", self.create_connection_tab,
+             self._load_connection_values, self._collect_connection_values),
+            ("Dashboard", self.create_dashboard_tab,
+             self._load_dashboard_values, self._collect_dashboard_values),
+            # Telemetry tab - DISABLED for now, needs more work
+            # ("Telemetry", self.create_telemetry_tab,
+            #  self._load_telemetry_values, self._collect_telemetry_values),
+            ("Alerts", self.create_alerts_tab,
+             self._load_alerts_values, self._collect_alerts_values),
+            ("Email", self.create_email_tab,
+             self._load_email_values, self._collect_email_values),
+            # Hardware values are saved per node by _save_hardware_settings_for_node
+            ("Hardware", self.create_hardware_tab,
+             self._load_hardware_values, None),
+            ("Logging", self.create_logging_tab,
+             self._load_logging_values, self._collect_logging_values),
+        ]
+        self._built_tabs = set()
+        
+        for title, _build, _load, _collect in self._tab_specs:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # Button frame
         button_layout = QHBoxLayout()
@@ -203,6 +285,15 @@ class SettingsDialogQt(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _ensure_tab_built(self, index: int):
+        """Build a tab's widgets and load its values the first time it is shown"""
+        if index < 0 or index in self._built_tabs:
+            return
+        _title, build, load, _collect = self._tab_specs[index]
+        build(self.tab_widget.widget(index))
+        self._built_tabs.add(index)
+        load()
+    
     def create_connection_tab(self, parent):
         """Create connection settings tab"""
         layout = QVBoxLayout(parent)
@@ -261,7 +352,7 @@ class SettingsDialogQt(QDialog):
         
         refresh_btn = QPushButton("↻")
         refresh_btn.setMaximumWidth(30)
-        refresh_btn.clicked.connect(self._refresh_serial_ports)
+        refresh_btn.clicked.connect(lambda: self._refresh_serial_ports(force=True))
         port_layout.addWidget(refresh_btn)
         
         serial_layout.addWidget(port_widget, 0, 1)
@@ -337,7 +428,7 @@ class SettingsDialogQt(QDialog):
         layout = QVBoxLayout(parent)
         
         info_label = QLabel("Select which telemetry fields to display in card view:")
-        info_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
+        info_label.setObjectName("sectionTitle")
         layout.addWidget(info_label)
         
         layout.addSpacing(10)
@@ -365,7 +456,7 @@ class SettingsDialogQt(QDialog):
             field_layout.addWidget(checkbox)
             
             desc_label = QLabel(description)
-            desc_label.setStyleSheet("color: gray; font-size: 10pt;")
+            desc_label.setObjectName("fieldDescription")
             field_layout.addWidget(desc_label)
             field_layout.addStretch()
             
@@ -397,7 +488,7 @@ class SettingsDialogQt(QDialog):
         offline_layout.addWidget(QLabel("minutes"))
         
         info_label = QLabel("(Offline status threshold: 16 min)")
-        info_label.setStyleSheet("color: gray; font-size: 8pt;")
+        info_label.setObjectName("smallHint")
         offline_layout.addWidget(info_label)
         offline_layout.addStretch()
         
@@ -476,10 +567,11 @@ class SettingsDialogQt(QDialog):
         
         smtp_layout.addWidget(QLabel("To Addresses:"), 4, 0)
         self.to_addresses = QLineEdit()
+        self.to_addresses.textEdited.connect(self._on_to_addresses_edited)
         smtp_layout.addWidget(self.to_addresses, 4, 1, 1, 3)
         
         hint_label = QLabel("(comma-separated)")
-        hint_label.setStyleSheet("color: gray;")
+        hint_label.setObjectName("hint")
         smtp_layout.addWidget(hint_label, 5, 1)
         
         self.use_tls = QCheckBox("Use TLS encryption")
@@ -495,6 +587,10 @@ class SettingsDialogQt(QDialog):
         
         layout.addStretch()
     
+    def _on_to_addresses_edited(self, text: str):
+        """Re-parse the recipient list only when the user actually edits it"""
+        self._to_addrs_model = [addr.strip() for addr in text.split(',') if addr.strip()]
+    
     def create_hardware_tab(self, parent):
         """Create hardware settings tab"""
         layout = QVBoxLayout(parent)
@@ -547,23 +643,23 @@ class SettingsDialogQt(QDialog):
         
         # Hint text
         hint_label = QLabel("(voltage across shunt at full scale current)")
-        hint_label.setStyleSheet("color: gray;")
+        hint_label.setObjectName("hint")
         sensor_layout.addWidget(hint_label, 2, 1, 1, 2)
         
         # Calculated values section
         sensor_layout.addWidget(QLabel("Shunt Resistance:"), 3, 0)
         self.shunt_resistance_display = QLabel("100.00 mΩ")
-        self.shunt_resistance_display.setStyleSheet("font-weight: bold; color: #4a90d9;")
+        self.shunt_resistance_display.setObjectName("metricValue")
         sensor_layout.addWidget(self.shunt_resistance_display, 3, 1, 1, 2)
         
         sensor_layout.addWidget(QLabel("Scaling Factor:"), 4, 0)
         self.scale_factor_display = QLabel("1.00x")
-        self.scale_factor_display.setStyleSheet("font-weight: bold; color: #4a90d9;")
+        self.scale_factor_display.setObjectName("metricValue")
         sensor_layout.addWidget(self.scale_factor_display, 4, 1, 1, 2)
         
         # Example calculation
         self.example_display = QLabel("Example: 100mA raw → 100mA scaled")
-        self.example_display.setStyleSheet("color: gray;")
+        self.example_display.setObjectName("hint")
         sensor_layout.addWidget(self.example_display, 5, 1, 1, 2)
         
         sensor_layout.setColumnStretch(2, 1)
@@ -580,8 +676,7 @@ class SettingsDialogQt(QDialog):
             "measurement, enter your shunt's specifications above.\n\n"
             "The scaling factor adjusts the reported current to match your hardware."
         )
-        help_label = QLabel(help_text)
-        help_label.setStyleSheet("font-size: 9pt; color: #aaaaaa;")
+        help_label = _static_text_label(help_text, "help")
         help_layout.addWidget(help_label)
         
         layout.addWidget(help_group)
@@ -603,7 +698,7 @@ class SettingsDialogQt(QDialog):
             if current_a > 0 and voltage_mv > 0:
                 # Calculate shunt resistance: R = V / I, R(mΩ) = V(mV) / I(A)
                 shunt_mohm = voltage_mv / current_a
-                self.shunt_resistance_display.setText(f"{shunt_mohm:.2f} mΩ")
+                _set_if_changed(self.shunt_resistance_display, f"{shunt_mohm:.2f} mΩ")
                 
                 # Calculate scaling factor: default_shunt / user_shunt
                 # Default shunt is 100mΩ (350mV / 3.5A)
@@ -611,24 +706,24 @@ class SettingsDialogQt(QDialog):
                 scale_factor = default_shunt / shunt_mohm if shunt_mohm > 0 else 1.0
                 
                 if enabled:
-                    self.scale_factor_display.setText(f"{scale_factor:.2f}x")
+                    _set_if_changed(self.scale_factor_display, f"{scale_factor:.2f}x")
                     # Example: show what 100mA raw becomes
                     scaled_example = 100 * scale_factor
                     if scaled_example >= 1000:
-                        self.example_display.setText(f"Example: 100mA raw → {scaled_example/1000:.2f}A scaled")
+                        _set_if_changed(self.example_display, f"Example: 100mA raw → {scaled_example/1000:.2f}A scaled")
                     else:
-                        self.example_display.setText(f"Example: 100mA raw → {scaled_example:.0f}mA scaled")
+                        _set_if_changed(self.example_display, f"Example: 100mA raw → {scaled_example:.0f}mA scaled")
                 else:
-                    self.scale_factor_display.setText("1.00x (disabled)")
-                    self.example_display.setText("Example: 100mA raw → 100mA scaled (no scaling)")
+                    _set_if_changed(self.scale_factor_display, "1.00x (disabled)")
+                    _set_if_changed(self.example_display, "Example: 100mA raw → 100mA scaled (no scaling)")
             else:
-                self.shunt_resistance_display.setText("-- mΩ")
-                self.scale_factor_display.setText("--")
-                self.example_display.setText("Enter valid values above")
+                _set_if_changed(self.shunt_resistance_display, "-- mΩ")
+                _set_if_changed(self.scale_factor_display, "--")
+                _set_if_changed(self.example_display, "Enter valid values above")
         except ValueError:
-            self.shunt_resistance_display.setText("-- mΩ")
-            self.scale_factor_display.setText("--")
-            self.example_display.setText("Enter valid numeric values")
+            _set_if_changed(self.shunt_resistance_display, "-- mΩ")
+            _set_if_changed(self.scale_factor_display, "--")
+            _set_if_changed(self.example_display, "Enter valid numeric values")
     
     def _on_hardware_node_changed(self, index):
         """Handle hardware node selector change - save current and load new"""
@@ -651,22 +746,31 @@ class SettingsDialogQt(QDialog):
     def _load_hardware_settings_for_node(self, node_id: str):
         """Load hardware settings for a specific node"""
         path = self._get_hardware_config_path(node_id)
+        settings = None
         
         # If this is a specific node, check if it has settings, otherwise use default
         if node_id != "default":
-            node_settings = self.config_manager.get(path)
-            if not node_settings:
+            settings = self.config_manager.get_path(_SENSOR_NODES_KEYS + (node_id,))
+            if not settings:
                 # No specific settings, show defaults but don't enable
                 path = "hardware.current_sensor.default"
-        
-        self.current_sensor_invert.setChecked(
-            self.config_manager.get(f'{path}.invert', False))
-        self.current_sensor_enabled.setChecked(
-            self.config_manager.get(f'{path}.enabled', False))
-        self.full_scale_voltage_mv.setText(
-            str(self.config_manager.get(f'{path}.full_scale_voltage_mv', 350)))
-        self.full_scale_current_a.setText(
-            str(self.config_manager.get(f'{path}.full_scale_current_a', 3.5)))
+        if not settings:
+            settings = self.config_manager.get_path(_SENSOR_DEFAULT_KEYS)
+        if not isinstance(settings, dict):
+            settings = {}
+        
+        self.current_sensor_invert.setChecked(settings.get('invert', False))
+        self.current_sensor_enabled.setChecked(settings.get('enabled', False))
+        
+        # Text for the line edits is cached per config path so switching back
+        # and forth between nodes doesn't re-stringify the same values
+        texts = self._hardware_text_cache.get(path)
+        if texts is None:
+            texts = (str(settings.get('full_scale_voltage_mv', 350)),
+                     str(settings.get('full_scale_current_a', 3.5)))
+            self._hardware_text_cache[path] = texts
+        self.full_scale_voltage_mv.setText(texts[0])
+        self.full_scale_current_a.setText(texts[1])
         
         self._update_current_calculations()
     
@@ -682,23 +786,28 @@ class SettingsDialogQt(QDialog):
             
             # For specific nodes, only save if settings differ from default
             if node_id != "default":
-                default_invert = self.config_manager.get('hardware.current_sensor.default.invert', False)
-                default_enabled = self.config_manager.get('hardware.current_sensor.default.enabled', False)
-                default_voltage = self.config_manager.get('hardware.current_sensor.default.full_scale_voltage_mv', 350)
-                default_current = self.config_manager.get('hardware.current_sensor.default.full_scale_current_a', 3.5)
+                defaults = self.config_manager.get_path(_SENSOR_DEFAULT_KEYS, _EMPTY_SECTION)
+                default_invert = defaults.get('invert', False)
+                default_enabled = defaults.get('enabled', False)
+                default_voltage = defaults.get('full_scale_voltage_mv', 350)
+                default_current = defaults.get('full_scale_current_a', 3.5)
                 
                 # If same as default, remove node-specific settings
                 if invert == default_invert and enabled == default_enabled and voltage == default_voltage and current == default_current:
-                    nodes = self.config_manager.get('hardware.current_sensor.nodes', {})
+                    nodes = self.config_manager.get_path(_SENSOR_NODES_KEYS, {})
                     if node_id in nodes:
                         del nodes[node_id]
                         self.config_manager.set('hardware.current_sensor.nodes', nodes)
+                    self._hardware_text_cache.pop(path, None)
                     return
             
-            self.config_manager.set(f'{path}.invert', invert)
-            self.config_manager.set(f'{path}.enabled', enabled)
-            self.config_manager.set(f'{path}.full_scale_voltage_mv', voltage)
-            self.config_manager.set(f'{path}.full_scale_current_a', current)
+            self._hardware_text_cache.pop(path, None)
+            self.config_manager.update_many({
+                f'{path}.invert': invert,
+                f'{path}.enabled': enabled,
+                f'{path}.full_scale_voltage_mv': voltage,
+                f'{path}.full_scale_current_a': current,
+            })
         except ValueError:
             pass  # Invalid values, don't save
 
@@ -733,8 +842,7 @@ class SettingsDialogQt(QDialog):
             "CRITICAL: Severe errors that may crash the application\n"
             "Disable Logging: Turn off all logging output"
         )
-        help_label = QLabel(help_text)
-        help_label.setStyleSheet("font-size: 8pt; color: gray;")
+        help_label = _static_text_label(help_text, "smallHint")
         level_layout.addWidget(help_label)
         
         layout.addWidget(level_group)
@@ -757,22 +865,20 @@ class SettingsDialogQt(QDialog):
         self.log_retention_days.setMaximumWidth(200)
         retention_layout.addWidget(self.log_retention_days)
         
-        retention_help = QLabel(
+        retention_help = _static_text_label(
             "Application logs (meshtastic_monitor.log) will be cleaned up automatically.\n"
-            "Node CSV logs are managed separately by the Data settings."
+            "Node CSV logs are managed separately by the Data settings.",
+            "smallHint"
         )
-        retention_help.setStyleSheet("font-size: 8pt; color: gray;")
         retention_layout.addWidget(retention_help)
         
         layout.addWidget(retention_group)
         layout.addStretch()
     
-    def _refresh_serial_ports(self):
+    def _refresh_serial_ports(self, force: bool = False):
         """Refresh the list of available serial ports"""
         try:
-            import serial.tools.list_ports
-            ports = serial.tools.list_ports.comports()
-            port_list = [port.device for port in sorted(ports)]
+            port_list = list(_enumerate_serial_ports(force))
             
             if not port_list:
                 # No ports found, provide common defaults
@@ -809,87 +915,120 @@ class SettingsDialogQt(QDialog):
     def _toggle_connection_fields(self):
         """Show/hide connection fields based on selected type"""
         is_tcp = self.tcp_radio.isChecked()
+        if is_tcp == self._last_conn_is_tcp:
+            return  # Already showing the right group - skip the relayout
+        if not is_tcp and self._last_conn_is_tcp is not None:
+            # User switched to serial - re-enumerate so a device plugged in
+            # since the dialog opened shows up
+            self._refresh_serial_ports(force=True)
+        self._last_conn_is_tcp = is_tcp
         self.tcp_group.setVisible(is_tcp)
         self.serial_group.setVisible(not is_tcp)
     
     def load_current_values(self):
-        """Load current configuration values into dialog"""
-        # Connection settings
-        interface_type = self.config_manager.get('meshtastic.interface.type', 'tcp')
+        """Load current configuration values into the tabs built so far"""
+        for index in sorted(self._built_tabs):
+            self._tab_specs[index][2]()
+    
+    def _load_connection_values(self):
+        """Load connection tab values from configuration"""
+        meshtastic = self.config_manager.get_all().get('meshtastic', _EMPTY_SECTION)
+        interface = meshtastic.get('interface', _EMPTY_SECTION)
+        
+        interface_type = interface.get('type', 'tcp')
         if interface_type == 'tcp':
             self.tcp_radio.setChecked(True)
         else:
             self.serial_radio.setChecked(True)
         
-        self.tcp_host.setText(self.config_manager.get('meshtastic.interface.host', '192.168.1.91'))
-        self.tcp_port.setText(str(self.config_manager.get('meshtastic.interface.port', 4403)))
+        self.tcp_host.setText(interface.get('host', '192.168.1.91'))
+        self.tcp_port.setText(str(interface.get('port', 4403)))
         
         # Load serial port and refresh available ports
         self._refresh_serial_ports()
-        saved_serial_port = self.config_manager.get('meshtastic.interface.serial_port', '')
+        saved_serial_port = interface.get('serial_port', '')
         if saved_serial_port:
             self.serial_port.setCurrentText(saved_serial_port)
-        self.serial_baud.setCurrentText(str(self.config_manager.get('meshtastic.interface.baud', 115200)))
+        self.serial_baud.setCurrentText(str(interface.get('baud', 115200)))
         
-        self.conn_timeout.setText(str(self.config_manager.get('meshtastic.connection_timeout', 30)))
-        self.retry_interval.setText(str(self.config_manager.get('meshtastic.retry_interval', 60)))
+        self.conn_timeout.setText(str(meshtastic.get('connection_timeout', 30)))
+        self.retry_interval.setText(str(meshtastic.get('retry_interval', 60)))
         
         # Toggle connection fields based on type
         self._toggle_connection_fields()
+    
+    def _load_dashboard_values(self):
+        """Load dashboard tab values from configuration"""
+        dashboard = self.config_manager.get_all().get('dashboard', _EMPTY_SECTION)
         
-        # Dashboard settings
-        self.time_format.setCurrentText(self.config_manager.get('dashboard.time_format', 'DDd:HHh:MMm:SSs'))
-        self.stale_row_seconds.setText(str(self.config_manager.get('dashboard.stale_row_seconds', 300)))
-        self.motion_display_seconds.setText(str(self.config_manager.get('dashboard.motion_display_seconds', 900)))
+        self.time_format.setCurrentText(dashboard.get('time_format', 'DDd:HHh:MMm:SSs'))
+        self.stale_row_seconds.setText(str(dashboard.get('stale_row_seconds', 300)))
+        self.motion_display_seconds.setText(str(dashboard.get('motion_display_seconds', 900)))
         
         # Temperature unit setting
-        temp_unit_value = self.config_manager.get('dashboard.temperature_unit', 'C')
+        temp_unit_value = dashboard.get('temperature_unit', 'C')
         self.temp_unit.setCurrentText('Celsius (°C)' if temp_unit_value == 'C' else 'Fahrenheit (°F)')
-        
-        # Telemetry field settings
-        telemetry_config = self.config_manager.get('dashboard.telemetry_fields', {})
+    
+    def _load_telemetry_values(self):
+        """Load telemetry field tab values from configuration"""
+        dashboard = self.config_manager.get_all().get('dashboard', _EMPTY_SECTION)
+        get_field = dashboard.get('telemetry_fields', _EMPTY_SECTION).get
         for field_key, checkbox in self.telemetry_vars.items():
-            checkbox.setChecked(telemetry_config.get(field_key, True))
-        
-        # Alert settings
-        self.offline_enabled.setChecked(self.config_manager.get('alerts.rules.node_offline.enabled', True))
-        offline_seconds = self.config_manager.get('alerts.rules.node_offline.threshold_seconds', 960)
+            checkbox.setChecked(get_field(field_key, True))
+    
+    def _load_alerts_values(self):
+        """Load alerts tab values from configuration"""
+        rules = self.config_manager.get_all().get('alerts', _EMPTY_SECTION).get('rules', _EMPTY_SECTION)
+        offline_rule = rules.get('node_offline', _EMPTY_SECTION)
+        voltage_rule = rules.get('low_voltage', _EMPTY_SECTION)
+        temp_rule = rules.get('high_temperature', _EMPTY_SECTION)
+        
+        self.offline_enabled.setChecked(offline_rule.get('enabled', True))
+        offline_seconds = offline_rule.get('threshold_seconds', 960)
         self.offline_threshold.setText(str(offline_seconds // 60))
         
-        self.voltage_enabled.setChecked(self.config_manager.get('alerts.rules.low_voltage.enabled', True))
-        self.voltage_threshold.setText(str(self.config_manager.get('alerts.rules.low_voltage.threshold_volts', 11.0)))
-        
-        self.temp_enabled.setChecked(self.config_manager.get('alerts.rules.high_temperature.enabled', True))
-        self.temp_threshold.setText(str(self.config_manager.get('alerts.rules.high_temperature.threshold_celsius', 35)))
+        self.voltage_enabled.setChecked(voltage_rule.get('enabled', True))
+        self.voltage_threshold.setText(str(voltage_rule.get('threshold_volts', 11.0)))
         
-        # Email settings
-        self.email_enabled.setChecked(self.config_manager.get('alerts.email_enabled', False))
-        self.smtp_server.setText(self.config_manager.get('alerts.email_config.smtp_server', 'smtp.mail.me.com'))
-        self.smtp_port.setText(str(self.config_manager.get('alerts.email_config.smtp_port', 587)))
-        self.smtp_username.setText(self.config_manager.get('alerts.email_config.username', ''))
-        self.smtp_password.setText(self.config_manager.get('alerts.email_config.password', ''))
-        self.from_address.setText(self.config_manager.get('alerts.email_config.from_address', ''))
-        to_addrs = self.config_manager.get('alerts.email_config.to_addresses', [])
+        self.temp_enabled.setChecked(temp_rule.get('enabled', True))
+        self.temp_threshold.setText(str(temp_rule.get('threshold_celsius', 35)))
+    
+    def _load_email_values(self):
+        """Load email tab values from configuration"""
+        alerts = self.config_manager.get_all().get('alerts', _EMPTY_SECTION)
+        email_config = alerts.get('email_config', _EMPTY_SECTION)
+        
+        self.email_enabled.setChecked(alerts.get('email_enabled', False))
+        self.smtp_server.setText(email_config.get('smtp_server', 'smtp.mail.me.com'))
+        self.smtp_port.setText(str(email_config.get('smtp_port', 587)))
+        self.smtp_username.setText(email_config.get('username', ''))
+        self.smtp_password.setText(email_config.get('password', ''))
+        self.from_address.setText(email_config.get('from_address', ''))
+        to_addrs = email_config.get('to_addresses', ())
+        self._to_addrs_model = list(to_addrs)
         self.to_addresses.setText(', '.join(to_addrs))
-        self.use_tls.setChecked(self.config_manager.get('alerts.email_config.use_tls', True))
+        self.use_tls.setChecked(email_config.get('use_tls', True))
+    
+    def _load_logging_values(self):
+        """Load logging tab values from configuration"""
+        logging_config = self.config_manager.get_all().get('logging', _EMPTY_SECTION)
         
-        # Logging settings
-        log_level = self.config_manager.get('logging.level', 'INFO')
+        log_level = logging_config.get('level', 'INFO')
         if log_level == 'NOTSET':
             self.log_level.setCurrentText('Disable Logging')
         else:
             self.log_level.setCurrentText(log_level)
         
-        retention_days = self.config_manager.get('logging.retention_days', -1)
+        retention_days = logging_config.get('retention_days', -1)
         if retention_days == -1:
             self.log_retention_days.setCurrentText('Forever')
         else:
             self.log_retention_days.setCurrentText(f'{retention_days} days')
-        
-        # Hardware settings - load for the currently selected node (default)
+    
+    def _load_hardware_values(self):
+        """Load hardware tab values for the currently selected node (default)"""
         self._current_hardware_node = "default"
-        if self.hardware_node_selector:
-            self.hardware_node_selector.setCurrentIndex(0)  # Select "Default (all nodes)"
+        self.hardware_node_selector.setCurrentIndex(0)  # Select "Default (all nodes)"
         self._load_hardware_settings_for_node(self._current_hardware_node)
     
     def test_email(self):
@@ -915,74 +1054,20 @@ class SettingsDialogQt(QDialog):
     def save_values(self):
         """Save dialog values to configuration"""
         try:
-            # Connection settings
-            conn_type = 'tcp' if self.tcp_radio.isChecked() else 'serial'
-            self.config_manager.set('meshtastic.interface.type', conn_type)
-            
-            if conn_type == 'tcp':
-                self.config_manager.set('meshtastic.interface.host', self.tcp_host.text())
-                self.config_manager.set('meshtastic.interface.port', int(self.tcp_port.text()))
-            else:  # serial
-                self.config_manager.set('meshtastic.interface.serial_port', self.serial_port.currentText())
-                self.config_manager.set('meshtastic.interface.baud', int(self.serial_baud.currentText()))
-            
-            self.config_manager.set('meshtastic.connection_timeout', int(self.conn_timeout.text()))
-            self.config_manager.set('meshtastic.retry_interval', int(self.retry_interval.text()))
-            
-            # Dashboard settings
-            self.config_manager.set('dashboard.time_format', self.time_format.currentText())
-            self.config_manager.set('dashboard.stale_row_seconds', int(self.stale_row_seconds.text()))
-            self.config_manager.set('dashboard.motion_display_seconds', int(self.motion_display_seconds.text()))
-            
-            # Temperature unit setting
-            temp_unit_value = 'C' if 'Celsius' in self.temp_unit.currentText() else 'F'
-            self.config_manager.set('dashboard.temperature_unit', temp_unit_value)
-            
-            # Telemetry field settings
-            telemetry_fields = {}
-            for field_key, checkbox in self.telemetry_vars.items():
-                telemetry_fields[field_key] = checkbox.isChecked()
-            self.config_manager.set('dashboard.telemetry_fields', telemetry_fields)
+            # Stage values from every built tab first (so a bad field leaves
+            # the config untouched), then apply them in one update_many()
+            # pass. Tabs never opened keep their existing config values.
+            updates = {}
+            for index in sorted(self._built_tabs):
+                collect = self._tab_specs[index][3]
+                if collect:
+                    collect(updates)
             
-            # Alert settings
-            self.config_manager.set('alerts.rules.node_offline.enabled', self.offline_enabled.isChecked())
-            offline_minutes = int(self.offline_threshold.text())
-            self.config_manager.set('alerts.rules.node_offline.threshold_seconds', offline_minutes * 60)
-            
-            self.config_manager.set('alerts.rules.low_voltage.enabled', self.voltage_enabled.isChecked())
-            self.config_manager.set('alerts.rules.low_voltage.threshold_volts', float(self.voltage_threshold.text()))
-            
-            self.config_manager.set('alerts.rules.high_temperature.enabled', self.temp_enabled.isChecked())
-            self.config_manager.set('alerts.rules.high_temperature.threshold_celsius', float(self.temp_threshold.text()))
-            
-            # Email settings
-            self.config_manager.set('alerts.email_enabled', self.email_enabled.isChecked())
-            self.config_manager.set('alerts.email_config.smtp_server', self.smtp_server.text())
-            self.config_manager.set('alerts.email_config.smtp_port', int(self.smtp_port.text()))
-            self.config_manager.set('alerts.email_config.username', self.smtp_username.text())
-            self.config_manager.set('alerts.email_config.password', self.smtp_password.text())
-            self.config_manager.set('alerts.email_config.from_address', self.from_address.text())
-            
-            to_addrs = [addr.strip() for addr in self.to_addresses.text().split(',') if addr.strip()]
-            self.config_manager.set('alerts.email_config.to_addresses', to_addrs)
-            self.config_manager.set('alerts.email_config.use_tls', self.use_tls.isChecked())
-            
-            # Logging settings
-            log_level_value = self.log_level.currentText()
-            if log_level_value == 'Disable Logging':
-                self.config_manager.set('logging.level', 'NOTSET')
-            else:
-                self.config_manager.set('logging.level', log_level_value)
-            
-            retention_value = self.log_retention_days.currentText()
-            if retention_value == 'Forever':
-                self.config_manager.set('logging.retention_days', -1)
-            else:
-                days = int(retention_value.split()[0])
-                self.config_manager.set('logging.retention_days', days)
+            self.config_manager.update_many(updates)
             
             # Hardware settings - save currently displayed node's settings
-            self._save_hardware_settings_for_node(self._current_hardware_node)
+            if self.hardware_node_selector is not None:
+                self._save_hardware_settings_for_node(self._current_hardware_node)
             
             # Save to file
             self.config_manager.save_config()
@@ -996,6 +1081,77 @@ class SettingsDialogQt(QDialog):
         
         return True
     
+    def _collect_connection_values(self, updates: dict):
+        """Stage connection tab values into updates"""
+        conn_type = 'tcp' if self.tcp_radio.isChecked() else 'serial'
+        updates['meshtastic.interface.type'] = conn_type
+        
+        if conn_type == 'tcp':
+            updates['meshtastic.interface.host'] = self.tcp_host.text()
+            updates['meshtastic.interface.port'] = int(self.tcp_port.text())
+        else:  # serial
+            updates['meshtastic.interface.serial_port'] = self.serial_port.currentText()
+            updates['meshtastic.interface.baud'] = int(self.serial_baud.currentText())
+        
+        updates['meshtastic.connection_timeout'] = int(self.conn_timeout.text())
+        updates['meshtastic.retry_interval'] = int(self.retry_interval.text())
+    
+    def _collect_dashboard_values(self, updates: dict):
+        """Stage dashboard tab values into updates"""
+        updates['dashboard.time_format'] = self.time_format.currentText()
+        updates['dashboard.stale_row_seconds'] = int(self.stale_row_seconds.text())
+        updates['dashboard.motion_display_seconds'] = int(self.motion_display_seconds.text())
+        
+        # Temperature unit setting
+        temp_unit_value = 'C' if 'Celsius' in self.temp_unit.currentText() else 'F'
+        updates['dashboard.temperature_unit'] = temp_unit_value
+    
+    def _collect_telemetry_values(self, updates: dict):
+        """Stage telemetry field tab values into updates"""
+        updates['dashboard.telemetry_fields'] = {
+            field_key: checkbox.isChecked()
+            for field_key, checkbox in self.telemetry_vars.items()
+        }
+    
+    def _collect_alerts_values(self, updates: dict):
+        """Stage alerts tab values into updates"""
+        updates['alerts.rules.node_offline.enabled'] = self.offline_enabled.isChecked()
+        offline_minutes = int(self.offline_threshold.text())
+        updates['alerts.rules.node_offline.threshold_seconds'] = offline_minutes * 60
+        
+        updates['alerts.rules.low_voltage.enabled'] = self.voltage_enabled.isChecked()
+        updates['alerts.rules.low_voltage.threshold_volts'] = float(self.voltage_threshold.text())
+        
+        updates['alerts.rules.high_temperature.enabled'] = self.temp_enabled.isChecked()
+        updates['alerts.rules.high_temperature.threshold_celsius'] = float(self.temp_threshold.text())
+    
+    def _collect_email_values(self, updates: dict):
+        """Stage email tab values into updates"""
+        updates['alerts.email_enabled'] = self.email_enabled.isChecked()
+        updates['alerts.email_config.smtp_server'] = self.smtp_server.text()
+        updates['alerts.email_config.smtp_port'] = int(self.smtp_port.text())
+        updates['alerts.email_config.username'] = self.smtp_username.text()
+        updates['alerts.email_config.password'] = self.smtp_password.text()
+        updates['alerts.email_config.from_address'] = self.from_address.text()
+        
+        updates['alerts.email_config.to_addresses'] = list(self._to_addrs_model)
+        updates['alerts.email_config.use_tls'] = self.use_tls.isChecked()
+    
+    def _collect_logging_values(self, updates: dict):
+        """Stage logging tab values into updates"""
+        log_level_value = self.log_level.currentText()
+        if log_level_value == 'Disable Logging':
+            updates['logging.level'] = 'NOTSET'
+        else:
+            updates['logging.level'] = log_level_value
+        
+        retention_value = self.log_retention_days.currentText()
+        if retention_value == 'Forever':
+            updates['logging.retention_days'] = -1
+        else:
+            days = int(retention_value.split()[0])
+            updates['logging.retention_days'] = days
+    
     def ok(self):
         """OK button handler"""
         if self.save_values():
@@ -1017,6 +1173,7 @@ class SettingsDialogQt(QDialog):
 # Test harness for standalone testing
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication
+    from config_manager import ConfigManager
     
     app = QApplication(sys.argv)
     
@@ -4,17 +4,31 @@ Test various battery symbol options for display on Raspberry Pi.
 Run this to see which symbols render correctly on your display.
 """
 
+import argparse
+import os
 import sys
+import time
+from functools import lru_cache
+from itertools import product
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QFrame, QGridLayout, QGroupBox, QScrollArea
+    QApplication, QWidget, QVBoxLayout, QLabel,
+    QGridLayout, QGroupBox, QScrollArea, QStyle, QStyleOptionFrame
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtCore import Qt, QEvent, QTimer
+from PySide6.QtGui import QFont, QFontDatabase, QFontMetrics, QImage, QPainter, QStaticText, QTransform
 
-# Symbol categories to test
-BATTERY_SYMBOLS = {
-    "ASCII Only (Always Works)": [
+# Use Liberation Sans - the font installed on Pi
+FONT_FAMILY = "Liberation Sans"
+
+# Approximate height of one row of symbol tiles, used to reserve space for
+# category groups that haven't been built yet
+_TILE_ROW_HEIGHT = 80
+
+# Symbol categories to test: (category name, ((symbol, description), ...)).
+# The U+XXXX codepoint is added to single-character descriptions when the
+# tile is built (see _tile_description), so it can't drift from the glyph.
+BATTERY_SYMBOLS = (
+    ("ASCII Only (Always Works)", (
         ("+", "Plus"),
         ("-", "Minus"),
         ("*", "Asterisk"),
@@ -23,222 +37,456 @@ BATTERY_SYMBOLS = {
         ("=", "Equals"),
         ("[+]", "Bracketed plus"),
         ("(+)", "Paren plus"),
-    ],
-    "Lightning/Power (for battery telemetry)": [
-        ("⚡", "U+26A1 High voltage"),
-        ("↯", "U+21AF Downwards zigzag"),
-        ("϶", "U+03F6 Lunate epsilon"),
-        ("ϟ", "U+03DF Greek koppa"),
-        ("⌁", "U+2301 Electric arrow"),
-        ("⏻", "U+23FB Power symbol"),
-        ("⏼", "U+23FC Power on-off"),
-        ("⏽", "U+23FD Power on"),
-    ],
-    "Mail/Envelope (for messaging)": [
-        ("✉", "U+2709 Envelope"),
-        ("✆", "U+2706 Telephone"),
-        ("☎", "U+260E Black telephone"),
-        ("☏", "U+260F White telephone"),
-        ("✇", "U+2707 Tape drive"),
-        ("⌨", "U+2328 Keyboard"),
-        ("📧", "U+1F4E7 Email symbol"),
-        ("📨", "U+1F4E8 Incoming envelope"),
-    ],
-    "Temperature/Thermometer": [
-        ("℃", "U+2103 Celsius"),
-        ("℉", "U+2109 Fahrenheit"),
-        ("°", "U+00B0 Degree"),
-        ("˚", "U+02DA Ring above"),
-        ("⌂", "U+2302 House"),
-        ("Θ", "U+0398 Theta"),
-        ("θ", "U+03B8 Small theta"),
-        ("⏱", "U+23F1 Stopwatch"),
-    ],
-    "WiFi/Antenna/Signal (for SNR)": [
-        ("⚲", "U+26B2 Neuter"),
-        ("⏃", "U+23C3 Dentistry symbol"),
-        ("⌗", "U+2317 Viewdata square"),
-        ("⌖", "U+2316 Position indicator"),
-        ("⎍", "U+238D Monostable"),
-        ("⎎", "U+238E Hysteresis"),
-        ("⎓", "U+2393 Direct current"),
-        ("⎌", "U+238C Benchmark"),
-    ],
-    "Water/Humidity": [
-        ("∿", "U+223F Sine wave"),
-        ("≈", "U+2248 Almost equal"),
-        ("≋", "U+224B Triple tilde"),
-        ("∼", "U+223C Tilde operator"),
-        ("⌇", "U+2307 Wavy line"),
-        ("⎰", "U+23B0 Upper left tortoise"),
-        ("⎱", "U+23B1 Lower right tortoise"),
-        ("〰", "U+3030 Wavy dash"),
-    ],
-    "Arrows (directional indicators)": [
-        ("→", "U+2192 Right arrow"),
-        ("←", "U+2190 Left arrow"),
-        ("↑", "U+2191 Up arrow"),
-        ("↓", "U+2193 Down arrow"),
-        ("↔", "U+2194 Left right"),
-        ("↕", "U+2195 Up down"),
-        ("⇒", "U+21D2 Double right"),
-        ("⇐", "U+21D0 Double left"),
-    ],
-    "Up/Down Arrows (for current measurement)": [
-        ("↑", "U+2191 Up arrow"),
-        ("↓", "U+2193 Down arrow"),
-        ("⇑", "U+21D1 Double up"),
-        ("⇓", "U+21D3 Double down"),
-        ("⇡", "U+21E1 Dashed up"),
-        ("⇣", "U+21E3 Dashed down"),
-        ("↟", "U+219F Two headed up"),
-        ("↡", "U+21A1 Two headed down"),
-    ],
-    "More Up/Down Arrows": [
-        ("⬆", "U+2B06 Black up arrow"),
-        ("⬇", "U+2B07 Black down arrow"),
-        ("▲", "U+25B2 Black up tri"),
-        ("▼", "U+25BC Black down tri"),
-        ("△", "U+25B3 White up tri"),
-        ("▽", "U+25BD White down tri"),
-        ("⏶", "U+23F6 Black medium up tri"),
-        ("⏷", "U+23F7 Black medium down tri"),
-    ],
-    "Arrow Variants": [
-        ("↥", "U+21A5 Up from bar"),
-        ("↧", "U+21A7 Down from bar"),
-        ("⤊", "U+290A Up triple arrow"),
-        ("⤋", "U+290B Down triple arrow"),
-        ("⥉", "U+2949 Up with horiz"),
-        ("⥌", "U+294C Up paired"),
-        ("⥍", "U+294D Down paired"),
-        ("⥏", "U+294F Up triangle-head"),
-    ],
-    "Location/GPS": [
-        ("⌖", "U+2316 Position indicator"),
-        ("⊕", "U+2295 Circled plus"),
-        ("⊗", "U+2297 Circled times"),
-        ("⊙", "U+2299 Circled dot"),
-        ("◎", "U+25CE Bullseye"),
-        ("◉", "U+25C9 Fisheye"),
-        ("⌾", "U+233E APL circle"),
-        ("⎊", "U+238A Circled triangle"),
-    ],
-    "Geometric Shapes": [
-        ("■", "U+25A0 Black square"),
-        ("□", "U+25A1 White square"),
-        ("▪", "U+25AA Small black sq"),
-        ("▫", "U+25AB Small white sq"),
-        ("▬", "U+25AC Black rect"),
-        ("▮", "U+25AE Black vert rect"),
-        ("●", "U+25CF Black circle"),
-        ("○", "U+25CB White circle"),
-    ],
-    "Triangles": [
-        ("▲", "U+25B2 Black up tri"),
-        ("△", "U+25B3 White up tri"),
-        ("▶", "U+25B6 Black right tri"),
-        ("▷", "U+25B7 White right tri"),
-        ("▼", "U+25BC Black down tri"),
-        ("◀", "U+25C0 Black left tri"),
-        ("►", "U+25BA Black right ptr"),
-        ("◄", "U+25C4 Black left ptr"),
-    ],
-    "Stars and Checks": [
-        ("★", "U+2605 Black star"),
-        ("☆", "U+2606 White star"),
-        ("✓", "U+2713 Check mark"),
-        ("✔", "U+2714 Heavy check"),
-        ("✗", "U+2717 Ballot X"),
-        ("✘", "U+2718 Heavy ballot X"),
-        ("✦", "U+2726 Black 4-star"),
-        ("✧", "U+2727 White 4-star"),
-    ],
-    "Misc Technical": [
-        ("⚙", "U+2699 Gear"),
-        ("⚠", "U+26A0 Warning"),
-        ("⛔", "U+26D4 No entry"),
-        ("☢", "U+2622 Radioactive"),
-        ("☣", "U+2623 Biohazard"),
-        ("⚛", "U+269B Atom symbol"),
-        ("⚬", "U+26AC Medium circle"),
-        ("⛭", "U+26ED Gear no hub"),
-    ],
-    "Weather/Nature": [
-        ("☀", "U+2600 Black sun"),
-        ("☁", "U+2601 Cloud"),
-        ("☂", "U+2602 Umbrella"),
-        ("☃", "U+2603 Snowman"),
-        ("☄", "U+2604 Comet"),
-        ("★", "U+2605 Star"),
-        ("☇", "U+2607 Lightning"),
-        ("☈", "U+2608 Thunderstorm"),
-    ],
-    "Block Elements": [
-        ("▀", "U+2580 Upper half"),
-        ("▄", "U+2584 Lower half"),
-        ("█", "U+2588 Full block"),
-        ("▌", "U+258C Left half"),
-        ("▐", "U+2590 Right half"),
-        ("░", "U+2591 Light shade"),
-        ("▒", "U+2592 Medium shade"),
-        ("▓", "U+2593 Dark shade"),
-    ],
-    "Greek Letters (common in tech)": [
-        ("Ω", "U+03A9 Omega"),
-        ("Δ", "U+0394 Delta"),
-        ("Σ", "U+03A3 Sigma"),
-        ("Π", "U+03A0 Pi"),
-        ("μ", "U+03BC Mu (micro)"),
-        ("α", "U+03B1 Alpha"),
-        ("β", "U+03B2 Beta"),
-        ("γ", "U+03B3 Gamma"),
-    ],
-    "Math Symbols": [
-        ("±", "U+00B1 Plus-minus"),
-        ("×", "U+00D7 Multiply"),
-        ("÷", "U+00F7 Divide"),
-        ("∞", "U+221E Infinity"),
-        ("√", "U+221A Square root"),
-        ("∑", "U+2211 Summation"),
-        ("∏", "U+220F Product"),
-        ("∂", "U+2202 Partial diff"),
-    ],
-}
+    )),
+    ("Lightning/Power (for battery telemetry)", (
+        ("⚡", "High voltage"),
+        ("↯", "Downwards zigzag"),
+        ("϶", "Lunate epsilon"),
+        ("ϟ", "Greek koppa"),
+        ("⌁", "Electric arrow"),
+        ("⏻", "Power symbol"),
+        ("⏼", "Power on-off"),
+        ("⏽", "Power on"),
+    )),
+    ("Mail/Envelope (for messaging)", (
+        ("✉", "Envelope"),
+        ("✆", "Telephone"),
+        ("☎", "Black telephone"),
+        ("☏", "White telephone"),
+        ("✇", "Tape drive"),
+        ("⌨", "Keyboard"),
+        ("📧", "Email symbol"),
+        ("📨", "Incoming envelope"),
+    )),
+    ("Temperature/Thermometer", (
+        ("℃", "Celsius"),
+        ("℉", "Fahrenheit"),
+        ("°", "Degree"),
+        ("˚", "Ring above"),
+        ("⌂", "House"),
+        ("Θ", "Theta"),
+        ("θ", "Small theta"),
+        ("⏱", "Stopwatch"),
+    )),
+    ("WiFi/Antenna/Signal (for SNR)", (
+        ("⚲", "Neuter"),
+        ("⏃", "Dentistry symbol"),
+        ("⌗", "Viewdata square"),
+        ("⌖", "Position indicator"),
+        ("⎍", "Monostable"),
+        ("⎎", "Hysteresis"),
+        ("⎓", "Direct current"),
+        ("⎌", "Benchmark"),
+    )),
+    ("Water/Humidity", (
+        ("∿", "Sine wave"),
+        ("≈", "Almost equal"),
+        ("≋", "Triple tilde"),
+        ("∼", "Tilde operator"),
+        ("⌇", "Wavy line"),
+        ("⎰", "Upper left tortoise"),
+        ("⎱", "Lower right tortoise"),
+        ("〰", "Wavy dash"),
+    )),
+    ("Arrows (directional indicators)", (
+        ("→", "Right arrow"),
+        ("←", "Left arrow"),
+        ("↑", "Up arrow"),
+        ("↓", "Down arrow"),
+        ("↔", "Left right"),
+        ("↕", "Up down"),
+        ("⇒", "Double right"),
+        ("⇐", "Double left"),
+    )),
+    ("Up/Down Arrows (for current measurement)", (
+        ("↑", "Up arrow"),
+        ("↓", "Down arrow"),
+        ("⇑", "Double up"),
+        ("⇓", "Double down"),
+        ("⇡", "Dashed up"),
+        ("⇣", "Dashed down"),
+        ("↟", "Two headed up"),
+        ("↡", "Two headed down"),
+    )),
+    ("More Up/Down Arrows", (
+        ("⬆", "Black up arrow"),
+        ("⬇", "Black down arrow"),
+        ("▲", "Black up tri"),
+        ("▼", "Black down tri"),
+        ("△", "White up tri"),
+        ("▽", "White down tri"),
+        ("⏶", "Black medium up tri"),
+        ("⏷", "Black medium down tri"),
+    )),
+    ("Arrow Variants", (
+        ("↥", "Up from bar"),
+        ("↧", "Down from bar"),
+        ("⤊", "Up triple arrow"),
+        ("⤋", "Down triple arrow"),
+        ("⥉", "Up with horiz"),
+        ("⥌", "Up paired"),
+        ("⥍", "Down paired"),
+        ("⥏", "Up triangle-head"),
+    )),
+    ("Location/GPS", (
+        ("⌖", "Position indicator"),
+        ("⊕", "Circled plus"),
+        ("⊗", "Circled times"),
+        ("⊙", "Circled dot"),
+        ("◎", "Bullseye"),
+        ("◉", "Fisheye"),
+        ("⌾", "APL circle"),
+        ("⎊", "Circled triangle"),
+    )),
+    ("Geometric Shapes", (
+        ("■", "Black square"),
+        ("□", "White square"),
+        ("▪", "Small black sq"),
+        ("▫", "Small white sq"),
+        ("▬", "Black rect"),
+        ("▮", "Black vert rect"),
+        ("●", "Black circle"),
+        ("○", "White circle"),
+    )),
+    ("Triangles", (
+        ("▲", "Black up tri"),
+        ("△", "White up tri"),
+        ("▶", "Black right tri"),
+        ("▷", "White right tri"),
+        ("▼", "Black down tri"),
+        ("◀", "Black left tri"),
+        ("►", "Black right ptr"),
+        ("◄", "Black left ptr"),
+    )),
+    ("Stars and Checks", (
+        ("★", "Black star"),
+        ("☆", "White star"),
+        ("✓", "Check mark"),
+        ("✔", "Heavy check"),
+        ("✗", "Ballot X"),
+        ("✘", "Heavy ballot X"),
+        ("✦", "Black 4-star"),
+        ("✧", "White 4-star"),
+    )),
+    ("Misc Technical", (
+        ("⚙", "Gear"),
+        ("⚠", "Warning"),
+        ("⛔", "No entry"),
+        ("☢", "Radioactive"),
+        ("☣", "Biohazard"),
+        ("⚛", "Atom symbol"),
+        ("⚬", "Medium circle"),
+        ("⛭", "Gear no hub"),
+    )),
+    ("Weather/Nature", (
+        ("☀", "Black sun"),
+        ("☁", "Cloud"),
+        ("☂", "Umbrella"),
+        ("☃", "Snowman"),
+        ("☄", "Comet"),
+        ("★", "Star"),
+        ("☇", "Lightning"),
+        ("☈", "Thunderstorm"),
+    )),
+    ("Block Elements", (
+        ("▀", "Upper half"),
+        ("▄", "Lower half"),
+        ("█", "Full block"),
+        ("▌", "Left half"),
+        ("▐", "Right half"),
+        ("░", "Light shade"),
+        ("▒", "Medium shade"),
+        ("▓", "Dark shade"),
+    )),
+    ("Greek Letters (common in tech)", (
+        ("Ω", "Omega"),
+        ("Δ", "Delta"),
+        ("Σ", "Sigma"),
+        ("Π", "Pi"),
+        ("μ", "Mu (micro)"),
+        ("α", "Alpha"),
+        ("β", "Beta"),
+        ("γ", "Gamma"),
+    )),
+    ("Math Symbols", (
+        ("±", "Plus-minus"),
+        ("×", "Multiply"),
+        ("÷", "Divide"),
+        ("∞", "Infinity"),
+        ("√", "Square root"),
+        ("∑", "Summation"),
+        ("∏", "Product"),
+        ("∂", "Partial diff"),
+    )),
+)
+
+# Sample dashboard labels shown in the "Example Usage" section
+EXAMPLE_LABELS = (
+    # Power/Battery items
+    ("⚡ ICP", "ICP battery"),
+    ("⚡ Node", "Node battery"),
+    ("⚡ Ch0", "Channel power"),
+    ("↯ Power", "Alt lightning"),
+    # Temperature
+    ("℃ Temp", "Celsius temp"),
+    ("° Temp", "Degree temp"),
+    # SNR/Signal
+    ("⌖ SNR", "Position SNR"),
+    ("⊕ SNR", "Circle+ SNR"),
+    # Humidity
+    ("≈ Humid", "Approx humidity"),
+    ("∿ Humid", "Wave humidity"),
+    # Messages
+    ("✉ Msg", "Envelope msg"),
+    ("☎ Call", "Phone"),
+    # Location
+    ("◎ GPS", "Bullseye GPS"),
+    ("⊙ Loc", "Circled dot"),
+    # Misc
+    ("⚙ Set", "Gear settings"),
+    ("⚠ Alert", "Warning alert"),
+    ("★ Fav", "Star favorite"),
+    ("✓ OK", "Check OK"),
+    # Weather
+    ("☀ Sun", "Sun weather"),
+    ("☁ Cloud", "Cloud"),
+)
+
+
+# Dark theme - the only stylesheet in the window; individual labels are
+# styled through their objectName
+_MAIN_STYLESHEET = """
+    QWidget {
+        background-color: #1e1e1e;
+        color: #e0e0e0;
+    }
+    QGroupBox {
+        color: #e0e0e0;
+        font-size: 11pt;
+        font-weight: bold;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QLabel#FontInfo {
+        color: #00ff00;
+        font-size: 9pt;
+    }
+    QLabel#Instructions {
+        color: #888888;
+        font-size: 10pt;
+    }
+    QScrollArea {
+        border: none;
+    }
+    QLabel#SymbolCell, QLabel#ExampleCell {
+        background-color: #2d2d2d;
+        border: 1px solid #444444;
+    }
+    QLabel#SymbolCell {
+        border-radius: 4px;
+        padding: 5px;
+        min-width: 40px;
+        min-height: 30px;
+    }
+    QLabel#SymbolDesc, QLabel#SymbolDescFallback {
+        color: #888888;
+        margin-bottom: 6px;
+    }
+    QLabel#SymbolDescFallback {
+        color: #cc8844;
+    }
+    QLabel#ExampleCell {
+        border-radius: 3px;
+        padding: 4px 8px;
+    }
+    QLabel#ExampleDesc {
+        color: #666666;
+        margin-bottom: 2px;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared QFont per (size, weight); widgets copy it in setFont(), so reuse is safe.
+    
+    Only call once a QApplication exists.
+    """
+    font = QFont(FONT_FAMILY, point_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _font_families():
+    """Installed font families, enumerated once (a full fontconfig scan on the Pi)"""
+    return tuple(QFontDatabase.families())
+
+
+@lru_cache(maxsize=None)
+def _font_metrics(point_size: int) -> QFontMetrics:
+    """Metrics of the shared tile font, used to check glyph coverage"""
+    return QFontMetrics(_font(point_size))
+
+
+def _in_font(symbol, point_size):
+    """True if FONT_FAMILY itself has every glyph (no fallback font needed)"""
+    metrics = _font_metrics(point_size)
+    return all(metrics.inFontUcs4(ord(char)) for char in symbol)
+
+
+def _grid_cells(items, columns):
+    """Pair each item with its (row, col) grid position, filling rows left to right"""
+    rows = -(-len(items) // columns)
+    return zip(product(range(rows), range(columns)), items)
+
+
+@lru_cache(maxsize=512)
+def _static_text(text: str, point_size: int) -> QStaticText:
+    """Shaped, prepared text shared by every tile showing the same symbol
+    
+    Several symbols (e.g. the triangles) appear in more than one category.
+    Only call once a QApplication exists.
+    """
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.PlainText)
+    static_text.prepare(QTransform(), _font(point_size))
+    return static_text
+
+
+class _StaticTextLabel(QLabel):
+    """QLabel for immutable text that paints through a cached QStaticText
+    
+    The text layout is shaped once instead of on every repaint, and the
+    finished tile (stylesheet frame, background and glyph) is kept in a
+    QImage back-buffer that is only re-rendered after a resize or a
+    style/font/palette change. Sizing and accessibility still come from QLabel.
+    """
+    
+    _INVALIDATING_EVENTS = frozenset((
+        QEvent.StyleChange, QEvent.FontChange, QEvent.PaletteChange,
+    ))
+    
+    def __init__(self, text, point_size, parent=None):
+        super().__init__(text, parent)
+        self.setFont(_font(point_size))
+        self._static_text = _static_text(text, point_size)
+        self._buffer = None
+    
+    def resizeEvent(self, event):
+        self._buffer = None
+        super().resizeEvent(event)
+    
+    def changeEvent(self, event):
+        if event.type() in self._INVALIDATING_EVENTS:
+            self._buffer = None
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        if self._buffer is None:
+            ratio = self.devicePixelRatioF()
+            self._buffer = QImage(self.size() * ratio, QImage.Format_ARGB32_Premultiplied)
+            self._buffer.setDevicePixelRatio(ratio)
+            self._buffer.fill(Qt.transparent)
+            self._paint_tile(self._buffer)
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._buffer)
+        painter.end()
+    
+    def _paint_tile(self, device):
+        painter = QPainter(device)
+        # Styled frame/background first, as QFrame.paintEvent would draw it
+        option = QStyleOptionFrame()
+        self.initStyleOption(option)
+        self.style().drawControl(QStyle.CE_ShapedFrame, option, painter, self)
+        # Text is drawn at whole-pixel positions with no shapes, so only text
+        # antialiasing is wanted; keep geometry AA off for the Pi's raster engine
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        rect = self.contentsRect()
+        size = self._static_text.size().toSize()
+        painter.drawStaticText(
+            rect.x() + (rect.width() - size.width()) // 2,
+            rect.y() + (rect.height() - size.height()) // 2,
+            self._static_text,
+        )
+        painter.end()
+
+
+def _check_symbols(symbols):
+    """Reject symbol entries that look like mojibake
+    
+    UTF-8 glyphs decoded with the wrong codec (e.g. '\u201a\u00f6\u00b0' for U+26A1)
+    turn into several non-ASCII characters; every real entry is either
+    plain ASCII or a single codepoint.
+    """
+    for category_name, entries in symbols:
+        for symbol, _ in entries:
+            if len(symbol) > 1 and not symbol.isascii():
+                raise ValueError(f"{category_name}: {symbol!r} is not a single codepoint "
+                                 f"(mis-encoded symbol table?)")
+
+
+def _tile_description(symbol, name):
+    """Description shown under a tile, e.g. 'U+25B2 Black up tri' for a non-ASCII glyph"""
+    if len(symbol) == 1 and not symbol.isascii():
+        return f"U+{ord(symbol):04X} {name}"
+    return name
+
+
+def _build_tile(symbol, description):
+    """Create the (symbol, description) label pair for one symbol tile"""
+    # Large symbol display - use Liberation Sans
+    symbol_label = _StaticTextLabel(symbol, 16)
+    symbol_label.setObjectName("SymbolCell")
+    
+    # Description - use Liberation Sans. Glyphs missing from the font are
+    # flagged rather than hidden: Qt may still draw them from a fallback
+    # font, and whether that looks acceptable is what this window is for.
+    description = _tile_description(symbol, description)
+    if _in_font(symbol, 16):
+        desc_label = QLabel(description)
+        desc_label.setObjectName("SymbolDesc")
+    else:
+        desc_label = QLabel(f"{description} (fallback)")
+        desc_label.setObjectName("SymbolDescFallback")
+    desc_label.setFont(_font(7))
+    desc_label.setAlignment(Qt.AlignCenter)
+    desc_label.setWordWrap(True)
+    return symbol_label, desc_label
 
 
 class SymbolTestWindow(QWidget):
-    """Window to display and test various symbols"""
+    """Window to display and test various symbols
+    
+    Other symbol test scripts should reuse this window with their own
+    symbol/example tables rather than copying the UI code:
     
-    def __init__(self):
+        window = SymbolTestWindow(MY_SYMBOLS, MY_EXAMPLES)
+    """
+    
+    def __init__(self, symbols=BATTERY_SYMBOLS, examples=EXAMPLE_LABELS, list_fonts=False):
         super().__init__()
+        _check_symbols(symbols)
+        self._symbols = symbols
+        self._examples = examples
+        self._list_fonts = list_fonts
         self.setWindowTitle("Battery Symbol Test - Check Rendering on Pi")
         self.setMinimumSize(700, 600)
         
-        # Dark theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-            QGroupBox {
-                color: #e0e0e0;
-                font-size: 11pt;
-                font-weight: bold;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
         
         self._setup_ui()
     
@@ -246,29 +494,26 @@ class SymbolTestWindow(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         
-        # Show available fonts for debugging (use static method to avoid deprecation)
-        families = QFontDatabase.families()
-        print(f"Available font families ({len(families)}):")
-        for f in families[:20]:  # First 20
-            print(f"  - {f}")
-        if len(families) > 20:
-            print(f"  ... and {len(families) - 20} more")
-        
-        # Use Liberation Sans - the font installed on Pi
-        FONT_FAMILY = "Liberation Sans"
+        # Show available fonts for debugging (use static method to avoid deprecation).
+        # Enumerating families can trigger a full fontconfig scan, so only on request.
+        if self._list_fonts:
+            families = _font_families()
+            print(f"Available font families ({len(families)}):")
+            for f in families[:20]:  # First 20
+                print(f"  - {f}")
+            if len(families) > 20:
+                print(f"  ... and {len(families) - 20} more")
         
         # Title
         title = QLabel("Battery Symbol Options - Test on Raspberry Pi")
-        title_font = QFont(FONT_FAMILY, 14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_font(14, bold=True))
         title.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title)
         
         # Show which font is being used
         actual_font = QFont(FONT_FAMILY)
         font_info = QLabel(f"Requested: {FONT_FAMILY} | Actual: {actual_font.family()}")
-        font_info.setStyleSheet("color: #00ff00; font-size: 9pt;")
+        font_info.setObjectName("FontInfo")
         font_info.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(font_info)
         
@@ -276,139 +521,115 @@ class SymbolTestWindow(QWidget):
             "Symbols that render as boxes or question marks won't work on the Pi.\n"
             "Look for symbols that display correctly and are visually clear."
         )
-        instructions.setStyleSheet("color: #888888; font-size: 10pt;")
+        instructions.setObjectName("Instructions")
         instructions.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(instructions)
         
         # Scrollable area for the content
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
         
         content = QWidget()
         layout = QVBoxLayout(content)
         
-        # Create groups for each category
-        for category_name, symbols in BATTERY_SYMBOLS.items():
+        # Fonts are resolved once and shared by every tile
+        example_font = _font(11)
+        desc_font = _font(7)
+        
+        # Create an empty group for each category; its tiles are built the
+        # first time the group scrolls into view (_populate_visible_groups)
+        self._pending_groups = []
+        for category_name, symbols in self._symbols:
             group = QGroupBox(category_name)
-            grid = QGridLayout(group)
-            grid.setSpacing(8)
-            
-            for i, (symbol, description) in enumerate(symbols):
-                row = i // 4
-                col = i % 4
-                
-                # Container for symbol + description
-                container = QWidget()
-                container_layout = QVBoxLayout(container)
-                container_layout.setContentsMargins(5, 5, 5, 5)
-                container_layout.setSpacing(2)
-                
-                # Large symbol display - use Liberation Sans
-                symbol_label = QLabel(symbol)
-                symbol_font = QFont(FONT_FAMILY, 16)
-                symbol_label.setFont(symbol_font)
-                symbol_label.setAlignment(Qt.AlignCenter)
-                symbol_label.setStyleSheet("""
-                    background-color: #2d2d2d;
-                    border: 1px solid #444444;
-                    border-radius: 4px;
-                    padding: 5px;
-                    min-width: 40px;
-                    min-height: 30px;
-                """)
-                container_layout.addWidget(symbol_label)
-                
-                # Description - use Liberation Sans
-                desc_label = QLabel(description)
-                desc_font = QFont(FONT_FAMILY, 7)
-                desc_label.setFont(desc_font)
-                desc_label.setStyleSheet("color: #888888;")
-                desc_label.setAlignment(Qt.AlignCenter)
-                desc_label.setWordWrap(True)
-                container_layout.addWidget(desc_label)
-                
-                grid.addWidget(container, row, col)
-            
+            # Reserve roughly the final height so the scrollbar range is sane
+            group.setMinimumHeight(_TILE_ROW_HEIGHT * -(-len(symbols) // 4))
             layout.addWidget(group)
+            self._pending_groups.append((group, symbols))
         
         # Example usage section
         example_group = QGroupBox("Example Usage in Dashboard Labels")
-        example_layout = QVBoxLayout(example_group)
-        
-        examples = [
-            # Power/Battery items
-            ("⚡ ICP", "ICP battery"),
-            ("⚡ Node", "Node battery"),
-            ("⚡ Ch0", "Channel power"),
-            ("↯ Power", "Alt lightning"),
-            # Temperature
-            ("℃ Temp", "Celsius temp"),
-            ("° Temp", "Degree temp"),
-            # SNR/Signal
-            ("⌖ SNR", "Position SNR"),
-            ("⊕ SNR", "Circle+ SNR"),
-            # Humidity
-            ("≈ Humid", "Approx humidity"),
-            ("∿ Humid", "Wave humidity"),
-            # Messages
-            ("✉ Msg", "Envelope msg"),
-            ("☎ Call", "Phone"),
-            # Location
-            ("◎ GPS", "Bullseye GPS"),
-            ("⊙ Loc", "Circled dot"),
-            # Misc
-            ("⚙ Set", "Gear settings"),
-            ("⚠ Alert", "Warning alert"),
-            ("★ Fav", "Star favorite"),
-            ("✓ OK", "Check OK"),
-            # Weather
-            ("☀ Sun", "Sun weather"),
-            ("☁ Cloud", "Cloud"),
-        ]
-        
-        example_grid = QGridLayout()
-        for i, (label, desc) in enumerate(examples):
-            row = i // 6
-            col = i % 6
-            
-            example_widget = QWidget()
-            example_widget_layout = QVBoxLayout(example_widget)
-            example_widget_layout.setContentsMargins(5, 2, 5, 2)
-            example_widget_layout.setSpacing(1)
-            
+        # Grid is installed directly on the group - no wrapper layout
+        example_grid = QGridLayout(example_group)
+        example_grid.setHorizontalSpacing(16)
+        example_grid.setVerticalSpacing(1)
+        for (row, col), (label, desc) in _grid_cells(self._examples, 6):
             label_display = QLabel(label)
-            label_font = QFont(FONT_FAMILY, 11)
-            label_display.setFont(label_font)
+            label_display.setFont(example_font)
             label_display.setAlignment(Qt.AlignCenter)
-            label_display.setStyleSheet("""
-                background-color: #2d2d2d;
-                border: 1px solid #444444;
-                border-radius: 3px;
-                padding: 4px 8px;
-            """)
-            example_widget_layout.addWidget(label_display)
+            label_display.setObjectName("ExampleCell")
+            example_grid.addWidget(label_display, row * 2, col)
             
             desc_label = QLabel(desc)
-            desc_font = QFont(FONT_FAMILY, 7)
             desc_label.setFont(desc_font)
-            desc_label.setStyleSheet("color: #666666;")
+            desc_label.setObjectName("ExampleDesc")
             desc_label.setAlignment(Qt.AlignCenter)
-            example_widget_layout.addWidget(desc_label)
-            
-            example_grid.addWidget(example_widget, row, col)
+            example_grid.addWidget(desc_label, row * 2 + 1, col)
         
-        example_layout.addLayout(example_grid)
         layout.addWidget(example_group)
         
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
+        
+        self._scroll = scroll
+        scroll_bar = scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._populate_visible_groups)
+        scroll_bar.rangeChanged.connect(self._populate_visible_groups)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Build the initially visible groups once the layout has geometry
+        QTimer.singleShot(0, self._populate_visible_groups)
+    
+    def _populate_visible_groups(self, *_args):
+        """Build the tiles of every pending group that is now in (or above) the viewport"""
+        bottom = self._scroll.verticalScrollBar().value() + self._scroll.viewport().height()
+        # Groups are stacked top to bottom, so stop at the first one still below the fold
+        while self._pending_groups and self._pending_groups[0][0].y() <= bottom:
+            group, symbols = self._pending_groups.pop(0)
+            self._populate_group(group, symbols)
+    
+    def _populate_group(self, group, symbols):
+        """Fill a category group box with its symbol tiles"""
+        grid = QGridLayout(group)
+        # Each symbol takes two grid rows (symbol, description) directly,
+        # rather than a container widget + layout per tile
+        grid.setHorizontalSpacing(18)
+        grid.setVerticalSpacing(2)
+        
+        for (row, col), (symbol, description) in _grid_cells(symbols, 4):
+            symbol_label, desc_label = _build_tile(symbol, description)
+            grid.addWidget(symbol_label, row * 2, col)
+            grid.addWidget(desc_label, row * 2 + 1, col)
+        
+        group.setMinimumHeight(0)
 
 
 def main():
-    app = QApplication(sys.argv)
-    window = SymbolTestWindow()
+    parser = argparse.ArgumentParser(description="Battery symbol rendering test")
+    parser.add_argument('--list-fonts', action='store_true',
+                        help="Print the available font families on startup")
+    parser.add_argument('--dry-run', '--headless', action='store_true',
+                        help="Build the window, render one frame offscreen and exit "
+                             "(for CI / timing the construction path)")
+    # Unrecognised arguments are left for Qt (e.g. -platform)
+    args, qt_args = parser.parse_known_args()
+    
+    if args.dry_run:
+        # No display needed unless the caller picked a platform explicitly
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    
+    start = time.perf_counter()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = SymbolTestWindow(list_fonts=args.list_fonts)
     window.show()
+    
+    if args.dry_run:
+        app.processEvents()
+        image = QImage(window.size(), QImage.Format_ARGB32)
+        window.render(image)
+        print(f"Window built and rendered in {(time.perf_counter() - start) * 1000:.0f} ms")
+        sys.exit(0)
+    
     sys.exit(app.exec())
 
 
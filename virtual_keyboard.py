@@ -14,14 +14,126 @@ Modifications for Meshtastic Dashboard:
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
+from functools import partial
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Key rows for the lowercase layer; multi-character names are action keys
+LOWERCASE_LAYOUT = {
+    'row1': ['`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '=', 'Bksp'],
+    'row2': ['Tab', 'q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '[', ']', '\\'],
+    'row3': ['Caps', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', ';', "'", 'Enter'],
+    'row4': ['z', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '/', '↑'],
+    'row5': ['Close', 'gap1', 'space', 'gap', '←', '↓', '→']
+}
+
+# Font shared by every key button
+KEY_FONT = ("Liberation Sans", 16, "bold")
+
+# Rows top to bottom with their left indent in pixels, staggering the rows like
+# a physical keyboard: row2 1/6 key, row3 2/4 key, row4 1 key, row5 (space bar row) 3/5 key
+KEY_ROWS = (('row1', 0), ('row2', 8), ('row3', 16), ('row4', 32), ('row5', 48))
+
+# US shift mapping for single-character keys, as a str.translate table
+_SHIFT_TABLE = str.maketrans(
+    "`1234567890-=[]\\;',./abcdefghijklmnopqrstuvwxyz",
+    '~!@#$%^&*()_+{}|:"<>?ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+
+def _shifted(key: str) -> str:
+    """Shifted form of a key; action keys ('Tab', 'space', ...) are unchanged"""
+    return key.translate(_SHIFT_TABLE) if len(key) == 1 else key
+
+
+# Uppercase/symbol layer, derived so the two layers can't drift apart
+UPPERCASE_LAYOUT = {
+    row: [_shifted(key) for key in keys]
+    for row, keys in LOWERCASE_LAYOUT.items()
+}
+
+# Action keys: name of the VirtualKeyboard operation to call and its arguments.
+# Any other key except Caps types itself.
+_KEY_ACTIONS = {
+    'Bksp': ('_backspace',),
+    'Enter': ('_enter',),
+    'Close': ('_close',),
+    'Tab': ('_insert_char', '\t'),
+    'space': ('_insert_char', ' '),
+    '↑': ('_arrow_up',),
+    '↓': ('_arrow_down',),
+    '←': ('_arrow_left',),
+    '→': ('_arrow_right',),
+}
+
+# Button width in characters of a plain character key
+KEY_SIZE = 4
+
+# Width (in characters) and color role of the non-character keys
+_KEY_STYLES = {
+    'Tab': (int(KEY_SIZE * 1.5), 'action'),
+    'Bksp': (int(KEY_SIZE * 1.5), 'action'),
+    'Caps': (int(KEY_SIZE * 1.75), 'action'),
+    'Enter': (int(KEY_SIZE * 1.75), 'action'),
+    'Close': (int(KEY_SIZE * 2), 'close'),
+    # Space bar width of c-m (5 keys visually)
+    'space': (int(KEY_SIZE * 6.5), 'letter'),
+    '↑': (KEY_SIZE, 'action'),
+    '↓': (KEY_SIZE, 'action'),
+    '←': (KEY_SIZE, 'action'),
+    '→': (KEY_SIZE, 'action'),
+}
+
+# Pixel width of the spacer pseudo-keys in the layouts
+_GAP_WIDTHS = {
+    'gap1': int(KEY_SIZE * 1.5 * 8),  # Between Close and space bar to prevent accidental touches
+    'gap': int(KEY_SIZE * 2.5 * 8),   # 2.5 key width spacer between space bar and arrows
+}
+
+
+def _key_style(key: str) -> tuple:
+    """Width and color role of a key; character keys are letter or punctuation"""
+    style = _KEY_STYLES.get(key)
+    if style is None:
+        style = (KEY_SIZE, 'letter' if key.isalpha() else 'punctuation')
+    return style
+
+
+def _compile_layout(layout: dict) -> tuple:
+    """Flatten a layout into per-row tuples of (key, text, left_pad, width, role)
+    
+    Row stagger and the gaps in the space bar row become extra left padding
+    on the following key, and the space bar gets no label (its key name is
+    bound into the command), so building the buttons needs no per-key logic.
+    """
+    rows = []
+    for row, stagger in KEY_ROWS:
+        keys = []
+        indent = stagger  # Extra left padding owed to the next key in this row
+        for key in layout[row]:
+            gap = _GAP_WIDTHS.get(key)
+            if gap is not None:
+                indent += gap
+                continue
+            width, role = _key_style(key)
+            keys.append((key, '' if key == 'space' else key, 2 + indent, width, role))
+            indent = 0
+        rows.append(tuple(keys))
+    return tuple(rows)
+
+
+# The button layer is built from the lowercase layout; Caps only re-labels it
+_COMPILED_LAYOUT = _compile_layout(LOWERCASE_LAYOUT)
+
 
 class VirtualKeyboard:
-    """Virtual keyboard optimized for touchscreens with 3-layer layout (lowercase, uppercase, symbols)"""
+    """Virtual keyboard optimized for touchscreens with a caps layer (lowercase / uppercase + symbols)"""
+    
+    # Shared instance handed out by get()
+    _instance = None
     
     def __init__(self, parent, target_widget, colors: dict = None):
         """
@@ -32,8 +144,12 @@ class VirtualKeyboard:
             target_widget: Text or Entry widget to type into
             colors: Color scheme dictionary (optional)
         """
-        self.target_widget = target_widget
-        self.keysize = 4  # Button width in characters
+        # Characters typed into a Text target since the last idle cycle, the
+        # change-notification flag, and whether a flush is already queued
+        self._pending_text = []
+        self._notify_pending = False
+        self._flush_scheduled = False
+        self.set_target(target_widget)
         
         # Default colors if none provided
         self.colors = colors or {
@@ -53,8 +169,30 @@ class VirtualKeyboard:
             'close': {'bg': '#c62828', 'fg': '#ffffff'}        # Red for close
         }
         
+        # Options identical for every key button, passed as **kwargs; the
+        # font is filled in by _build() once there is a window to own it
+        self._common_btn_kwargs = {'relief': 'flat', 'bd': 0, 'takefocus': 0}
+        
+        # Button color options per key role (normal and pressed look the same)
+        self._key_color_kwargs = {
+            role: {'bg': c['bg'], 'fg': c['fg'], 'activebackground': c['bg'], 'activeforeground': c['fg']}
+            for role, c in self.key_colors.items()
+        }
+        
+        # Tk widgets are created on first show() (_build) - dashboard startup
+        # doesn't pay for a keyboard the user may never open
+        self._parent = parent
+        self.window = None
+    
+    def _build(self):
+        """Create the keyboard window and its buttons"""
+        parent = self._parent
         # Create keyboard window
         self.window = tk.Toplevel(parent)
+        # Don't show at instantiation - start withdrawn (StackOverflow pattern).
+        # Done before anything else so the window is never mapped while the
+        # ~100 buttons below are packed; show() sizes it in one idle pass.
+        self.window.withdraw()
         self.window.title("Keyboard")
         self.window.configure(bg=self.colors['bg_frame'])
         
@@ -62,18 +200,27 @@ class VirtualKeyboard:
         # Acceptable for touch keyboard - no decorations needed
         self.window.overrideredirect(True)
         
-        # Don't show at instantiation - start withdrawn (StackOverflow pattern)
-        self.window.withdraw()
-        # Position will be set when first shown
+        # Position will be set when first shown, and again if the parent moves
         self._positioned = False
+        self._kb_size = None  # (width, height), measured on first show
+        self._window_xy = None  # Last position applied with geometry()
+        self._parent_config = None  # Parent (x, y, width, height) last seen in <Configure>
+        self._shown = False  # Mapped by show(), withdrawn by hide()
+        self._configure_funcid = parent.bind('<Configure>', self._on_parent_configure, add='+')
         
         # Make it stay on top
         self.window.attributes('-topmost', True)
         
+        # One named font shared by all keys: Tk resolves and measures it once
+        # instead of parsing the font description for every button. Kept on
+        # self - the named font is deleted when the Font object is collected.
+        self._key_font = tkfont.Font(self.window, font=KEY_FONT)
+        self._common_btn_kwargs['font'] = self._key_font
+        
         # Add minimal close button (since overrideredirect removes title bar)
         close_btn = tk.Button(self.window, text='✕', 
                              bg='#c62828', fg='#ffffff',
-                             font=("Liberation Sans", 16, "bold"),
+                             font=self._key_font,
                              relief='flat', bd=0, padx=3, pady=0,
                              command=self._close)
         close_btn.pack(side='top', anchor='ne')
@@ -82,337 +229,411 @@ class VirtualKeyboard:
         self.container = tk.Frame(self.window, bg=self.colors['bg_frame'])
         self.container.pack(padx=5, pady=5)
         
-        # Define keyboard layouts
-        self.lowercase = {
-            'row1': ['`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '=', 'Bksp'],
-            'row2': ['Tab', 'q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '[', ']', '\\'],
-            'row3': ['Caps', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', ';', "'", 'Enter'],
-            'row4': ['z', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '/', '↑'],
-            'row5': ['Close', 'gap1', 'space', 'gap', '←', '↓', '→']
-        }
-        self.uppercase = {
-            'row1': ['~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', 'Bksp'],
-            'row2': ['Tab', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '{', '}', '|'],
-            'row3': ['Caps', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ':', '"', 'Enter'],
-            'row4': ['Z', 'X', 'C', 'V', 'B', 'N', 'M', '<', '>', '?', '↑'],
-            'row5': ['Close', 'gap1', 'space', 'gap', '←', '↓', '→']
-        }
-        
-        # Create frames for each keyboard layer
-        self.lowercase_frame = tk.Frame(self.container, bg=self.colors['bg_frame'])
-        self.lowercase_frame.grid(row=0, column=0, sticky="nsew")
+        # Keyboard layouts (shared, built once at import)
+        self.lowercase = LOWERCASE_LAYOUT
+        self.uppercase = UPPERCASE_LAYOUT
         
-        self.uppercase_frame = tk.Frame(self.container, bg=self.colors['bg_frame'])
-        self.uppercase_frame.grid(row=0, column=0, sticky="nsew")
+        # One set of key buttons; Caps re-labels the shifted keys in place
+        # (_apply_caps) instead of raising a second, fully built layer
+        self.keys_frame = tk.Frame(self.container, bg=self.colors['bg_frame'])
+        self.keys_frame.grid(row=0, column=0, sticky="nsew")
         
-        # Initialize caps lock state and button storage BEFORE creating layers
+        # Initialize caps lock state and button storage BEFORE creating the keys
         self._caps_enabled = False
         self._buttons = {}
         
-        # Initialize all keyboard layers
-        self._init_keyboard_layer(self.lowercase_frame, self.lowercase)
-        self._init_keyboard_layer(self.uppercase_frame, self.uppercase)
+        self._init_keyboard_layer(self.keys_frame, _COMPILED_LAYOUT)
         
-        # Show lowercase by default
-        self.lowercase_frame.tkraise()
+        # Re-label table for Caps, built on first use (_apply_caps)
+        self._shift_slots = None
         
         logger.info("Virtual keyboard created")
     
-    def _init_keyboard_layer(self, frame, layout):
-        """Initialize a keyboard layer with buttons"""
-        # Row 1 - number/symbol row - NO stagger
-        row1_frame = tk.Frame(frame, bg=self.colors['bg_frame'])
-        row1_frame.pack()
-        for key in layout['row1']:
-            width, colors = self._get_key_style(key)
-            btn = tk.Button(row1_frame, text=key, width=width,
-                     font=("Liberation Sans", 16, "bold"),
-                     bg=colors['bg'], fg=colors['fg'],
-                     activebackground=colors['bg'], activeforeground=colors['fg'],
-                     relief='flat', bd=0, takefocus=0)
-            btn.config(command=lambda k=key, b=btn: self._key_press(k, b))
-            btn.pack(side='left', padx=2, pady=2)
-            self._buttons[key] = btn
-        
-        # Row 2 - qwerty row - stagger 1/6 key (8 pixels)
-        row2_frame = tk.Frame(frame, bg=self.colors['bg_frame'])
-        row2_frame.pack()
-        tk.Frame(row2_frame, width=8, bg=self.colors['bg_frame']).pack(side='left')
-        for key in layout['row2']:
-            width, colors = self._get_key_style(key)
-            btn = tk.Button(row2_frame, text=key, width=width,
-                     font=("Liberation Sans", 16, "bold"),
-                     bg=colors['bg'], fg=colors['fg'],
-                     activebackground=colors['bg'], activeforeground=colors['fg'],
-                     relief='flat', bd=0, takefocus=0)
-            btn.config(command=lambda k=key, b=btn: self._key_press(k, b))
-            btn.pack(side='left', padx=2, pady=2)
-            self._buttons[key] = btn
-        
-        # Row 3 - asdf row - stagger 2/4 key (16 pixels)
-        row3_frame = tk.Frame(frame, bg=self.colors['bg_frame'])
-        row3_frame.pack()
-        tk.Frame(row3_frame, width=16, bg=self.colors['bg_frame']).pack(side='left')
-        for key in layout['row3']:
-            width, colors = self._get_key_style(key)
-            btn = tk.Button(row3_frame, text=key, width=width,
-                     font=("Liberation Sans", 16, "bold"),
-                     bg=colors['bg'], fg=colors['fg'],
-                     activebackground=colors['bg'], activeforeground=colors['fg'],
-                     relief='flat', bd=0, takefocus=0)
-            btn.config(command=lambda k=key, b=btn: self._key_press(k, b))
-            btn.pack(side='left', padx=2, pady=2)
-            self._buttons[key] = btn
-        
-        # Row 4 - zxcv row - stagger 1 key (32 pixels)
-        row4_frame = tk.Frame(frame, bg=self.colors['bg_frame'])
-        row4_frame.pack()
-        tk.Frame(row4_frame, width=32, bg=self.colors['bg_frame']).pack(side='left')
-        for key in layout['row4']:
-            width, colors = self._get_key_style(key)
-            btn = tk.Button(row4_frame, text=key, width=width,
-                     font=("Liberation Sans", 16, "bold"),
-                     bg=colors['bg'], fg=colors['fg'],
-                     activebackground=colors['bg'], activeforeground=colors['fg'],
-                     relief='flat', bd=0, takefocus=0)
-            btn.config(command=lambda k=key, b=btn: self._key_press(k, b))
-            btn.pack(side='left', padx=2, pady=2)
-            self._buttons[key] = btn
-        
-        # Row 5 - space bar row
-        row5_frame = tk.Frame(frame, bg=self.colors['bg_frame'])
-        row5_frame.pack()
-        # Add left spacer - shift right by 3/5 key (approx 48px)
-        tk.Frame(row5_frame, width=48, bg=self.colors['bg_frame']).pack(side='left')
-        for key in layout['row5']:
-            if key == 'gap1':
-                # Gap between Close and space bar to prevent accidental touches
-                tk.Frame(row5_frame, width=int(self.keysize * 1.5 * 8), bg=self.colors['bg_frame']).pack(side='left')
-                continue
-            elif key == 'gap':
-                # 2.5 key width spacer between space bar and arrows
-                tk.Frame(row5_frame, width=int(self.keysize * 2.5 * 8), bg=self.colors['bg_frame']).pack(side='left')
-                continue
-            elif key == 'space':
-                width = int(self.keysize * 6.5)  # Space bar width of c-m (5 keys visually)
-                text = ' '
-                colors = self.key_colors['letter']
-            else:
-                width, colors = self._get_key_style(key)
-                text = key
-            
-            btn = tk.Button(row5_frame, text=text, width=width,
-                     font=("Liberation Sans", 16, "bold"),
-                     bg=colors['bg'], fg=colors['fg'],
-                     activebackground=colors['bg'], activeforeground=colors['fg'],
-                     relief='flat', bd=0, takefocus=0)
-            btn.config(command=lambda k=key, b=btn: self._key_press(k, b))
-            btn.pack(side='left', padx=2, pady=2)
-            self._buttons[key] = btn
-    
-    def _get_key_style(self, key):
-        """Get width and colors for a key"""
-        # Modifier keys (wider)
-        if key in ['Tab', 'Bksp']:
-            return int(self.keysize * 1.5), self.key_colors['action']
-        elif key in ['Caps', 'Enter']:
-            return int(self.keysize * 1.75), self.key_colors['action']
-        elif key == 'Close':
-            return int(self.keysize * 2), self.key_colors['close']
-        # Arrow keys
-        elif key in ['↑', '↓', '←', '→']:
-            return int(self.keysize), self.key_colors['action']
-        # Letter keys
-        elif key.isalpha():
-            return int(self.keysize), self.key_colors['letter']
-        # Punctuation/numbers
-        else:
-            return int(self.keysize), self.key_colors['punctuation']
-    
-    def _flash_key(self, button):
-        """Flash the pressed key briefly"""
-        if not button:
-            return
+    @classmethod
+    def get(cls, parent, target_widget, colors: dict = None):
+        """Return the shared keyboard for parent, pointed at target_widget
+        
+        The keyboard (Toplevel + ~50 buttons) is built once and reused for
+        every field in the same parent window. A Tk Toplevel can't be
+        re-parented, so a new one is built when the parent changes, when the
+        previous parent (and with it the keyboard) has been destroyed, or
+        when colors differs from the scheme the keyboard was built with
+        (colors=None always reuses). A keyboard that is replaced is destroyed.
+        """
+        keyboard = cls._instance
         try:
-            if button.winfo_exists():
-                original_bg = button.cget('bg')
-                # Flash to lighter color
-                button.config(bg='#ffffff')
-                # Restore original color after 100ms
-                button.after(100, lambda: button.config(bg=original_bg) if button.winfo_exists() else None)
+            reusable = (keyboard is not None
+                        and keyboard._parent is parent
+                        and parent.winfo_exists()
+                        and (keyboard.window is None or keyboard.window.winfo_exists())
+                        and (colors is None or colors == keyboard.colors))
         except tk.TclError:
-            # Button was destroyed or doesn't exist
-            pass
+            reusable = False
+        if reusable:
+            keyboard.set_target(target_widget)
+            return keyboard
+        if keyboard is not None:
+            # Don't leave the old Toplevel on screen with nothing tracking it
+            try:
+                keyboard.destroy()
+            except tk.TclError:
+                pass  # Already gone with its parent
+        keyboard = cls._instance = cls(parent, target_widget, colors)
+        return keyboard
     
-    def _key_press(self, key, button=None):
-        """Handle key press"""
-        # Mode switching (do this first, before flash, to minimize redraw artifacts)
-        if key == 'Caps':
-            # Toggle caps lock on/off
-            if hasattr(self, '_caps_enabled') and self._caps_enabled:
-                # Turn off caps
-                self._caps_enabled = False
-                self.lowercase_frame.tkraise()
-            else:
-                # Turn on caps
-                self._caps_enabled = True
-                self.uppercase_frame.tkraise()
-            # Flash AFTER tkraise to avoid double-draw - DISABLED for testing
-            #if button:
-            #    self._flash_key(button)
-            # Keep focus on target widget to prevent flash
-            self.target_widget.focus_set()
-            return
-        
-        # Flash the key (for non-Caps keys) - DISABLED for testing
-        #if button:
-        #    self._flash_key(button)
-        
-        # Action keys
-        if key == 'Bksp':
-            self._backspace()
-        elif key == 'Enter':
-            self._enter()
-        elif key == 'Close':
-            self._close()
-        elif key == 'Tab':
-            self._insert_char('\t')
-        elif key == 'space':
-            self._insert_char(' ')
-        # Arrow keys
-        elif key == '↑':
-            self._arrow_up()
-        elif key == '↓':
-            self._arrow_down()
-        elif key == '←':
-            self._arrow_left()
-        elif key == '→':
-            self._arrow_right()
-        # Regular keys
+    def set_target(self, target_widget):
+        """Point the keyboard at a Text or Entry widget"""
+        if self._pending_text or self._notify_pending:
+            # Queued taps and their change notification still belong to the
+            # previous target - deliver them before switching
+            self._flush_pending()
+        self.target_widget = target_widget
+        # Raw Tcl access to the target: edits, cursor moves and notifications
+        # call the interpreter directly instead of going through the tkinter
+        # wrapper methods (attribute lookup + argument marshalling per call)
+        self._target_path = str(target_widget)
+        self._tk_call = target_widget.tk.call
+        # Resolve the edit and cursor operations for the target's widget type
+        # once, so key presses don't repeat the isinstance checks
+        if isinstance(target_widget, tk.Text):
+            self._insert_char = self._insert_char_text
+            self._backspace = self._backspace_text
+            self._enter = self._enter_text
+            self._arrow_up = partial(self._move_text_cursor, 'insert-1l')
+            self._arrow_down = partial(self._move_text_cursor, 'insert+1l')
+            self._arrow_left = partial(self._move_text_cursor, 'insert-1c')
+            self._arrow_right = partial(self._move_text_cursor, 'insert+1c')
+        elif isinstance(target_widget, tk.Entry):
+            self._insert_char = self._insert_char_entry
+            self._backspace = self._backspace_entry
+            # Single-line: Enter inserts nothing, up/down have nowhere to go
+            self._enter = self._arrow_up = self._arrow_down = self._ignore_key
+            self._arrow_left = self._arrow_left_entry
+            self._arrow_right = self._arrow_right_entry
         else:
-            self._insert_char(key)
+            self._insert_char = self._backspace = self._enter = self._ignore_key
+            self._arrow_up = self._arrow_down = self._ignore_key
+            self._arrow_left = self._arrow_right = self._ignore_key
+        # Whether anything listens for <<Modified>> on the target; refreshed
+        # on every show() so bindings added after construction are seen
+        self._has_modified_listeners = self._check_modified_listeners()
+    
+    def _apply_caps(self):
+        """Re-label the shifted keys for the current caps state
         
+        Only the text changes: the buttons' commands (_type_shiftable) read
+        the caps state themselves, so no new Tcl commands are registered.
+        """
+        if self._shift_slots is None:
+            # For every key that differs between the layers: the button and its
+            # label indexed by caps state (False/0 off, True/1 on), prepared on
+            # the first Caps press
+            self._shift_slots = [
+                (self._buttons[lower], (lower, upper))
+                for row in self.lowercase
+                for lower, upper in zip(self.lowercase[row], self.uppercase[row])
+                if lower != upper
+            ]
+        state = self._caps_enabled
+        for button, labels in self._shift_slots:
+            button.configure(text=labels[state])
+    
+    def _init_keyboard_layer(self, frame, rows):
+        """Initialize a keyboard layer with buttons
+        
+        rows is a compiled layout (_compile_layout) with stagger, gaps and
+        widths already resolved, so the only widgets are the row frames and
+        the keys themselves and only the colors are looked up here.
+        """
+        bg = self.colors['bg_frame']
+        color_kwargs = self._key_color_kwargs
+        common_kwargs = self._common_btn_kwargs
+        for keys in rows:
+            row_frame = tk.Frame(frame, bg=bg)
+            row_frame.pack()
+            for key, text, left_pad, width, role in keys:
+                btn = tk.Button(row_frame, text=text, width=width,
+                                command=self._key_command(key),
+                                **color_kwargs[role], **common_kwargs)
+                btn.pack(side='left', padx=(left_pad, 2), pady=2)
+                self._buttons[key] = btn
+    
+    def _type_char(self, char):
+        """Handle a character key press"""
+        self._insert_char(char)
         # CRITICAL FIX: Restore focus to target widget after every key press
         # This prevents focus events from triggering and causing window flash
-        self.target_widget.focus_set()
-    
-    def _insert_char(self, char):
-        """Insert character into target widget"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.insert('insert', char)
-            # DISABLED - these event_generate calls may trigger window redraws
-            #self.target_widget.event_generate('<<Modified>>')
-            #self.target_widget.event_generate('<KeyRelease>')
-        elif isinstance(self.target_widget, tk.Entry):
-            current_pos = self.target_widget.index('insert')
-            self.target_widget.insert(current_pos, char)
-    
-    def _backspace(self):
-        """Handle backspace"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.delete('insert-1c', 'insert')
-            # DISABLED - these event_generate calls may trigger window redraws
-            #self.target_widget.event_generate('<<Modified>>')
-            #self.target_widget.event_generate('<KeyRelease>')
-        elif isinstance(self.target_widget, tk.Entry):
-            current_pos = self.target_widget.index('insert')
-            if current_pos > 0:
-                self.target_widget.delete(current_pos - 1, current_pos)
-    
-    def _enter(self):
-        """Handle enter/return"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.insert('insert', '\n')
-            self.target_widget.event_generate('<<Modified>>')
-            self.target_widget.event_generate('<KeyRelease>')
-    
-    def _arrow_up(self):
-        """Move cursor up"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.mark_set('insert', 'insert-1l')
-    
-    def _arrow_down(self):
-        """Move cursor down"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.mark_set('insert', 'insert+1l')
-    
-    def _arrow_left(self):
-        """Move cursor left"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.mark_set('insert', 'insert-1c')
-        elif isinstance(self.target_widget, tk.Entry):
-            pos = self.target_widget.index('insert')
-            if pos > 0:
-                self.target_widget.icursor(pos - 1)
-    
-    def _arrow_right(self):
-        """Move cursor right"""
-        if isinstance(self.target_widget, tk.Text):
-            self.target_widget.mark_set('insert', 'insert+1c')
-        elif isinstance(self.target_widget, tk.Entry):
-            pos = self.target_widget.index('insert')
-            self.target_widget.icursor(pos + 1)
+        self._tk_call('focus', self._target_path)
+    
+    def _type_shiftable(self, lower, upper):
+        """Handle a key press for a key with a different caps-lock character"""
+        self._type_char(upper if self._caps_enabled else lower)
+    
+    def _press_action(self, action, *args):
+        """Handle an action key press: call the named operation, then refocus
+        
+        The operation is looked up by name at press time because set_target()
+        swaps the per-widget-type implementations after the buttons exist.
+        """
+        getattr(self, action)(*args)
+        self._tk_call('focus', self._target_path)
+    
+    def _toggle_caps(self):
+        """Handle the Caps key: toggle caps lock on/off"""
+        self._caps_enabled ^= True
+        self._apply_caps()
+        # Keep focus on target widget to prevent flash
+        self._tk_call('focus', self._target_path)
+    
+    def _key_command(self, key):
+        """Button command for a key, chosen once when the button is created"""
+        if key == 'Caps':
+            return self._toggle_caps
+        action = _KEY_ACTIONS.get(key)
+        if action is not None:
+            return partial(self._press_action, *action)
+        upper = _shifted(key)
+        if upper != key:
+            return partial(self._type_shiftable, key, upper)
+        return partial(self._type_char, key)
+    
+    def _insert_char_text(self, char):
+        """Queue a character for a Text target
+        
+        Taps are collected and inserted with a single Text insert per Tk idle
+        cycle (_flush), so a burst of fast taps can't pile up one insert +
+        listener round per key behind a slow <<Modified>> handler.
+        """
+        self._pending_text.append(char)
+        self._schedule_flush()
+    
+    def _insert_char_entry(self, char):
+        """Insert character into an Entry target"""
+        # Entry accepts the 'insert' index directly - no need to resolve it first
+        self._tk_call(self._target_path, 'insert', 'insert', char)
+    
+    def _backspace_text(self):
+        """Handle backspace in a Text target"""
+        self._flush_text()
+        self._tk_call(self._target_path, 'delete', 'insert-1c', 'insert')
+        self._notify_changed()
+    
+    def _backspace_entry(self):
+        """Handle backspace in an Entry target"""
+        current_pos = int(self._tk_call(self._target_path, 'index', 'insert'))
+        if current_pos > 0:
+            self._tk_call(self._target_path, 'delete', current_pos - 1)
+    
+    def _enter_text(self):
+        """Handle enter/return in a Text target"""
+        self._insert_char_text('\n')
+    
+    def _ignore_key(self, *args):
+        """Edit operation for targets that don't support it"""
+    
+    def _notify_changed(self):
+        """Tell listeners on the target widget that its text changed
+        
+        Fires a single <<Modified>> per Tk idle cycle, however many keys were
+        handled in between, so listeners (length counters etc.) run once rather
+        than per key. No synthetic <KeyRelease> is sent - no key was released.
+        """
+        self._notify_pending = True
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Queue _flush for the next idle cycle unless it is already queued"""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.window.after_idle(self._flush)
+    
+    def _flush_text(self):
+        """Insert queued characters now - called before any edit or cursor
+        move that must see them in the widget"""
+        if self._pending_text:
+            text = ''.join(self._pending_text)
+            self._pending_text.clear()
+            self._tk_call(self._target_path, 'insert', 'insert', text)
+            self._notify_pending = True
+    
+    def _flush(self):
+        """Idle callback: insert queued text and deliver one change notification"""
+        self._flush_scheduled = False
+        self._flush_pending()
+    
+    def _flush_pending(self):
+        """Insert queued text and deliver a pending change notification to
+        the current target"""
+        try:
+            self._flush_text()
+            if self._notify_pending:
+                self._notify_pending = False
+                if (self._has_modified_listeners
+                        and int(self._tk_call('winfo', 'exists', self._target_path))):
+                    self._tk_call('event', 'generate', self._target_path, '<<Modified>>')
+        except tk.TclError:
+            # Target was destroyed while the flush was queued
+            self._pending_text.clear()
+            self._notify_pending = False
+    
+    def _move_text_cursor(self, index):
+        """Move the insert mark of a Text target (index like 'insert-1l')"""
+        self._flush_text()
+        self._tk_call(self._target_path, 'mark', 'set', 'insert', index)
+    
+    def _arrow_left_entry(self):
+        """Move cursor left in an Entry target"""
+        pos = int(self._tk_call(self._target_path, 'index', 'insert'))
+        if pos > 0:
+            self._tk_call(self._target_path, 'icursor', pos - 1)
+    
+    def _arrow_right_entry(self):
+        """Move cursor right in an Entry target"""
+        pos = int(self._tk_call(self._target_path, 'index', 'insert'))
+        self._tk_call(self._target_path, 'icursor', pos + 1)
     
     def _close(self):
         """Close keyboard - withdraw instead of destroy (StackOverflow pattern)"""
         self.hide()
     
+    def _check_modified_listeners(self):
+        """True if any of the target's bindtags has a <<Modified>> binding"""
+        try:
+            return any(self.target_widget.bind_class(tag, '<<Modified>>')
+                       for tag in self.target_widget.bindtags())
+        except tk.TclError:
+            return False
+    
+    def _on_parent_configure(self, event):
+        """Parent moved/resized: recompute the keyboard position
+        
+        Bound on the parent, so <Configure> from its children arrives here too
+        (bindtags) - only the parent's own events matter.
+        """
+        if event.widget is not self.window.master:
+            return
+        # Configure also fires for stacking/border changes - only a real
+        # move or resize of the parent needs a new position
+        parent_config = (event.x, event.y, event.width, event.height)
+        if parent_config == self._parent_config:
+            return
+        self._parent_config = parent_config
+        # destroy() removes this binding, but the Toplevel itself can be
+        # destroyed behind the keyboard's back (e.g. parent.destroy() on
+        # its children), leaving the binding in place
+        if not self.window.winfo_exists():
+            return
+        self._positioned = False
+        if self._shown:
+            self._position()
+    
+    def _position(self):
+        """Place the keyboard below (or above) the parent, centered on it"""
+        if self._kb_size is None:
+            # Only needed once - the keyboard's requested size never changes
+            self.window.update_idletasks()
+            self._kb_size = (self.window.winfo_reqwidth(), self.window.winfo_reqheight())
+        kb_width, kb_height = self._kb_size
+        
+        # Screen size and parent geometry in one Tcl round trip. winfo_geometry()
+        # isn't a substitute: for a toplevel its x/y include the WM frame,
+        # whereas rootx/rooty are the client area the keyboard lines up with.
+        parent = str(self.window.master)
+        tk_ = self.window.tk
+        (screen_width, screen_height,
+         parent_x, parent_y, parent_width, parent_height) = map(int, tk_.splitlist(tk_.eval(
+            f'list [winfo screenwidth {parent}] [winfo screenheight {parent}] '
+            f'[winfo rootx {parent}] [winfo rooty {parent}] '
+            f'[winfo width {parent}] [winfo height {parent}]')))
+        
+        # Calculate Y position (above or below parent)
+        parent_bottom = parent_y + parent_height
+        space_below = screen_height - parent_bottom
+        
+        if space_below < kb_height + 20:
+            # Position above parent
+            y = parent_y - kb_height - 5
+            logger.debug(f"Insufficient space below ({space_below}px), positioning above")
+        else:
+            # Position below parent
+            y = parent_bottom + 5
+            logger.debug(f"Sufficient space below ({space_below}px), positioning below")
+        
+        # Center keyboard horizontally relative to parent
+        parent_center_x = parent_x + (parent_width // 2)
+        x = parent_center_x - (kb_width // 2)
+        
+        # Ensure keyboard doesn't go off-screen
+        if x < 0:
+            x = 0
+            logger.debug(f"Adjusted X to 0 (would have been off left edge)")
+        elif x + kb_width > screen_width:
+            x = screen_width - kb_width
+            logger.debug(f"Adjusted X to {x} (would have been off right edge)")
+        
+        if (x, y) != self._window_xy:
+            logger.debug(f"Positioning keyboard at ({x}, {y}), centered on parent")
+            self.window.geometry(f"+{x}+{y}")
+            self._window_xy = (x, y)
+        self._positioned = True
+    
     def show(self):
         """Show the keyboard"""
-        logger.info(f"show() called, current state: {self.window.state()}")
-        # Position below parent on first show
+        if self.window is None:
+            self._build()
+        # The state in these messages costs a Tcl round trip - only ask for it
+        # when INFO is actually being logged
+        log_state = logger.isEnabledFor(logging.INFO)
+        if log_state:
+            logger.info(f"show() called, current state: {self.window.state()}")
+        # Position relative to the parent on first show, or after the parent
+        # moved (_on_parent_configure) while the keyboard was hidden
         if not self._positioned:
-            self.window.update_idletasks()
-            parent = self.window.master
-            
-            # Get screen dimensions and keyboard size
-            screen_width = self.window.winfo_screenwidth()
-            screen_height = self.window.winfo_screenheight()
-            kb_width = self.window.winfo_reqwidth()
-            kb_height = self.window.winfo_reqheight()
-            
-            # Calculate Y position (above or below parent)
-            parent_bottom = parent.winfo_rooty() + parent.winfo_height()
-            space_below = screen_height - parent_bottom
-            
-            if space_below < kb_height + 20:
-                # Position above parent
-                y = parent.winfo_rooty() - kb_height - 5
-                logger.info(f"Insufficient space below ({space_below}px), positioning above")
-            else:
-                # Position below parent
-                y = parent_bottom + 5
-                logger.info(f"Sufficient space below ({space_below}px), positioning below")
-            
-            # Center keyboard horizontally relative to parent
-            parent_center_x = parent.winfo_rootx() + (parent.winfo_width() // 2)
-            x = parent_center_x - (kb_width // 2)
-            
-            # Ensure keyboard doesn't go off-screen
-            if x < 0:
-                x = 0
-                logger.info(f"Adjusted X to 0 (would have been off left edge)")
-            elif x + kb_width > screen_width:
-                x = screen_width - kb_width
-                logger.info(f"Adjusted X to {x} (would have been off right edge)")
-            
-            logger.info(f"Positioning keyboard at ({x}, {y}), centered on parent")
-            self.window.geometry(f"+{x}+{y}")
-            self._positioned = True
+            self._position()
         
+        self._has_modified_listeners = self._check_modified_listeners()
         self.window.deiconify()
-        logger.info(f"Keyboard shown, new state: {self.window.state()}")
+        self._shown = True
+        if log_state:
+            logger.info(f"Keyboard shown, new state: {self.window.state()}")
     
     def hide(self):
         """Hide the keyboard"""
+        if self.window is None:
+            return  # Never shown, nothing to hide
         try:
             if self.window.winfo_exists():
-                logger.info(f"hide() called, current state: {self.window.state()}")
+                log_state = logger.isEnabledFor(logging.INFO)
+                if log_state:
+                    logger.info(f"hide() called, current state: {self.window.state()}")
                 self.window.withdraw()
-                logger.info(f"Keyboard hidden, new state: {self.window.state()}")
+                self._shown = False
+                if log_state:
+                    logger.info(f"Keyboard hidden, new state: {self.window.state()}")
         except Exception as e:
             logger.debug(f"Keyboard hide() skipped - window may be destroyed: {e}")
     
     def destroy(self):
-        """Destroy the keyboard"""
-        self.window.destroy()
+        """Destroy the keyboard - only for application/dialog shutdown; to
+        dismiss it between uses call hide() so the buttons are reused"""
+        if self.window is not None:
+            self._unbind_parent_configure()
+            self.window.destroy()
+    
+    def _unbind_parent_configure(self):
+        """Remove only this keyboard's handler from the parent's <Configure>
+        
+        tkinter's unbind(seq, funcid) clears the parent's other <Configure>
+        handlers too on older Pythons, so the bind script is rewritten
+        without this handler's line instead.
+        """
+        parent = self._parent
+        funcid = self._configure_funcid
+        try:
+            script = parent.tk.call('bind', str(parent), '<Configure>')
+            keep = '\n'.join(line for line in script.split('\n')
+                              if not line.startswith(f'if {{"[{funcid} '))
+            parent.tk.call('bind', str(parent), '<Configure>', keep)
+            parent.deletecommand(funcid)
+        except tk.TclError:
+            pass  # Parent already destroyed, and its bindings with it